@@ -0,0 +1,64 @@
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.game import Game
+from players.smart_ai_player import SmartAIPlayer
+from ui.pygame_frontend import PygameFrontend
+
+def measure(board_size=8, frames=600, fps=60, ai_in_process=False):
+    """
+    Time the frames of an AI-vs-AI game in the pygame frontend.
+
+    The AIs think on the frontend's worker, so the frame times show how
+    responsive the window stays while a decision is in progress.
+
+    Args:
+        board_size (int): Size of the board (default 8).
+        frames (int): Number of frames to run (default 600).
+        fps (int): Target frame rate (default 60).
+        ai_in_process (bool): Run the AI in a separate process instead of a thread.
+
+    Returns:
+        tuple: (frame times in seconds, frames spent waiting on the AI, moves played).
+    """
+    game = Game(SmartAIPlayer("AI 1", think_delay=0), SmartAIPlayer("AI 2", think_delay=0), board_size=board_size)
+    frontend = PygameFrontend(game, fps=fps, ai_in_process=ai_in_process)
+    timings = []
+    thinking = 0
+    try:
+        for _ in range(frames):
+            start = time.perf_counter()
+            frontend.run_frame()
+            timings.append(time.perf_counter() - start)
+            thinking += frontend.pending is not None
+            frontend.clock.tick(fps)
+    finally:
+        frontend.close()
+    return timings, thinking, len(game.history)
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame-time benchmark of the pygame frontend (SDL dummy driver).")
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--fps", type=int, default=60)
+    parser.add_argument("--process", action="store_true", help="run the AI in a separate process")
+    args = parser.parse_args()
+    with contextlib.redirect_stdout(io.StringIO()):
+        timings, thinking, moves = measure(args.size, args.frames, args.fps, args.process)
+    timings.sort()
+    print(f"{len(timings)} frames on a {args.size}x{args.size} board, {moves} moves, AI thinking in {thinking} frames")
+    print(f"  frame time median {statistics.median(timings) * 1000:.2f} ms, "
+          f"p99 {timings[int(0.99 * (len(timings) - 1))] * 1000:.2f} ms, max {timings[-1] * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
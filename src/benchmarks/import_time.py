@@ -0,0 +1,48 @@
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENGINE_MODULES = ["game.board", "game.card", "game.game", "players.smart_ai_player"]
+
+_PROBE = """
+import sys, time
+stdout = sys.stdout
+start = time.perf_counter()
+import {modules}
+elapsed = time.perf_counter() - start
+assert "colorama" not in sys.modules, "engine import pulled in colorama"
+assert sys.stdout is stdout, "engine import replaced sys.stdout"
+print(elapsed)
+"""
+
+def measure(repeat=20):
+    """
+    Time a cold import of the engine modules in fresh interpreters.
+
+    Each run also checks that the import has no UI side effects.
+
+    Args:
+        repeat (int): Number of fresh interpreters to start (default 20).
+
+    Returns:
+        list: Import times in seconds, one per run.
+    """
+    code = _PROBE.format(modules=", ".join(ENGINE_MODULES))
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=SRC_DIR, check=True, capture_output=True, text=True
+        ).stdout
+        timings.append(float(output))
+    return timings
+
+def main():
+    timings = measure()
+    print(f"Engine import ({', '.join(ENGINE_MODULES)}) over {len(timings)} runs:")
+    print(f"  median {statistics.median(timings) * 1000:.2f} ms, max {max(timings) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+from .board import CombinationType
+
+# For each direction: first window start (row, col), step between the 3 cards,
+# and the step between conflicting windows (windows on the same line), oriented
+# so that the window at -k * step is checked earlier by Board.check_combinations.
+_DIRECTIONS = {
+    CombinationType.HORIZONTAL: ((0, 0), (0, 1), (0, 1)),
+    CombinationType.VERTICAL: ((0, 0), (1, 0), (1, 0)),
+    CombinationType.DIAGONAL_DOWN: ((0, 0), (1, 1), (1, 1)),
+    CombinationType.DIAGONAL_UP: ((2, 0), (-1, 1), (1, -1))
+}
+
+def _window_view(grids, combo_type):
+    """
+    Return a read-only (B, R, C, 3) strided view of the cards of every window in a direction.
+
+    Element [b, i, j] is the window whose first card is at (i + row0, j + col0).
+    """
+    size = grids.shape[1]
+    (row0, col0), (step_row, step_col), _ = _DIRECTIONS[combo_type]
+    rows = size - 2 if step_row else size
+    cols = size - 2 if step_col else size
+    base = grids[:, row0:, col0:]
+    stride_batch, stride_row, stride_col = base.strides
+    return as_strided(
+        base,
+        shape=(grids.shape[0], rows, cols, 3),
+        strides=(stride_batch, stride_row, stride_col, step_row * stride_row + step_col * stride_col),
+        writeable=False
+    )
+
+def _shift(array, d_row, d_col, fill):
+    """Return b with b[:, i, j] = array[:, i + d_row, j + d_col], or fill outside the array."""
+    result = np.full_like(array, fill)
+    rows, cols = array.shape[1:]
+    result[:, max(0, -d_row):rows - max(0, d_row), max(0, -d_col):cols - max(0, d_col)] = \
+        array[:, max(0, d_row):rows - max(0, -d_row), max(0, d_col):cols - max(0, -d_col)]
+    return result
+
+class BatchScore:
+    """Scored windows and points of a batch of boards, as computed by score_batch."""
+
+    def __init__(self, scored, completed_by, points):
+        """
+        Args:
+            scored (dict): CombinationType -> (B, R, C) bool array of scored windows.
+            completed_by (dict): CombinationType -> (B, R, C) index of the player who completed each window.
+            points (np.ndarray): (B, players) points per player.
+        """
+        self.scored = scored
+        self.completed_by = completed_by
+        self.points = points
+
+    def scored_combinations(self, index):
+        """
+        Return the scored windows of one board in the format of Board.scored_combinations.
+
+        Args:
+            index (int): Position of the board in the batch.
+
+        Returns:
+            dict: CombinationType -> set of (start_row, start_col).
+        """
+        result = {}
+        for combo_type, scored in self.scored.items():
+            (row0, col0), _, _ = _DIRECTIONS[combo_type]
+            rows, cols = np.nonzero(scored[index])
+            result[combo_type] = {(int(r) + row0, int(c) + col0) for r, c in zip(rows, cols)}
+        return result
+
+def score_batch(values, order, owners=None, players=2):
+    """
+    Recompute the scoring of many boards of the same size at once.
+
+    A window is checked exactly once, by the move that fills its last cell. It
+    scores if its cards sum to 10 and none of them was already used in that
+    direction by a window that scored earlier (an earlier move, or the same move
+    earlier in Board.check_combinations' scan order). Windows that share a card in
+    the same direction are resolved by repeatedly accepting every window that
+    precedes all its undecided neighbours, which gives exactly Board's result.
+
+    Args:
+        values: (B, N, N) card values, 0 for empty cells.
+        order: (B, N, N) index of the move that placed each card, -1 for empty cells.
+        owners: (B, N, N) index of the player who placed each card
+            (default: players alternate, starting with player 0 at move 0).
+        players (int): Number of players (default 2).
+
+    Returns:
+        BatchScore: Scored windows per direction and points per player.
+    """
+    values = np.ascontiguousarray(values, dtype=np.int64)
+    order = np.ascontiguousarray(order, dtype=np.int64)
+    owners = order % players if owners is None else np.ascontiguousarray(owners, dtype=np.int64)
+    size = values.shape[1]
+
+    scored = {}
+    completed_by = {}
+    points = np.zeros((values.shape[0], players), dtype=np.int64)
+    for combo_type, ((row0, col0), _, (conflict_row, conflict_col)) in _DIRECTIONS.items():
+        window_values = _window_view(values, combo_type)
+        window_order = _window_view(order, combo_type)
+        last = window_order.argmax(axis=-1)
+        completing_move = np.take_along_axis(window_order, last[..., None], axis=-1)[..., 0]
+        completer = np.take_along_axis(_window_view(owners, combo_type), last[..., None], axis=-1)[..., 0]
+        valid = (window_values > 0).all(axis=-1) & (window_values.sum(axis=-1) == 10)
+
+        rows, cols = valid.shape[1:]
+        along = np.arange(cols)[None, None, :] if combo_type == CombinationType.HORIZONTAL \
+            else np.arange(rows)[None, :, None] + row0
+        key = np.where(valid, completing_move * size + along, np.iinfo(np.int64).max)
+
+        result = np.zeros_like(valid)
+        undecided = valid.copy()
+        offsets = [(k * conflict_row, k * conflict_col) for k in (-2, -1, 1, 2)]
+        while undecided.any():
+            blocked = np.zeros_like(undecided)
+            for d_row, d_col in offsets:
+                blocked |= _shift(undecided, d_row, d_col, False) & (_shift(key, d_row, d_col, 0) < key)
+            ready = undecided & ~blocked
+            result |= ready
+            taken = ready.copy()
+            for d_row, d_col in offsets:
+                taken |= _shift(ready, d_row, d_col, False)
+            undecided &= ~taken
+
+        scored[combo_type] = result
+        completed_by[combo_type] = completer
+        for player in range(players):
+            points[:, player] += (result & (completer == player)).sum(axis=(1, 2))
+    return BatchScore(scored, completed_by, points)
+
+def stack_records(records):
+    """
+    Build score_batch inputs from recorded games (see Game.to_record) of one board size.
+
+    Args:
+        records: Sequence of game records, all with the same board size.
+
+    Returns:
+        tuple: (values, order, owners) arrays of shape (len(records), N, N).
+    """
+    size = records[0]["board_size"]
+    values = np.zeros((len(records), size, size), dtype=np.int64)
+    order = np.full((len(records), size, size), -1, dtype=np.int64)
+    owners = np.zeros((len(records), size, size), dtype=np.int64)
+    for b, record in enumerate(records):
+        if record["board_size"] != size:
+            raise ValueError("All records of a batch must have the same board size")
+        for move, (player_idx, value, row, col) in enumerate(record["moves"]):
+            values[b, row, col] = value
+            order[b, row, col] = move
+            owners[b, row, col] = player_idx
+    return values, order, owners
@@ -1,8 +1,7 @@
-import colorama
-from colorama import Fore, Back, Style
+import random
+import struct
 from enum import Enum, auto
-
-colorama.init(autoreset=True)
+from .card import Card
 
 class CombinationType(Enum):
     HORIZONTAL = auto()
@@ -10,6 +9,83 @@ class CombinationType(Enum):
     DIAGONAL_UP = auto()
     DIAGONAL_DOWN = auto()
 
+# Bit of each direction in the used-direction masks of snapshots and feature arrays.
+DIRECTION_BITS = {combo_type: 1 << bit for bit, combo_type in enumerate(CombinationType)}
+_USED_BY_MASK = [
+    frozenset(combo_type for combo_type, bit in DIRECTION_BITS.items() if mask & bit)
+    for mask in range(16)
+]
+
+def direction_mask(used):
+    """
+    Pack a set of combination types into a 4-bit mask of DIRECTION_BITS.
+    
+    Args:
+        used: The combination types, e.g. a cell of card_used_in_combination.
+        
+    Returns:
+        int: The mask, between 0 and 15.
+    """
+    mask = 0
+    for combo_type in used:
+        mask |= DIRECTION_BITS[combo_type]
+    return mask
+
+SNAPSHOT_MAGIC = b"3B"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<2sBBB")
+_CARDS = {value: Card(value) for value in range(1, 9)}
+
+def pack_player_id(name):
+    """
+    Encode a player id as a length-prefixed UTF-8 string for a snapshot.
+    
+    Args:
+        name (str): The player id, at most 255 bytes once encoded.
+        
+    Returns:
+        bytes: One length byte followed by the encoded id.
+        
+    Raises:
+        ValueError: If name is not a string or is too long.
+    """
+    if not isinstance(name, str):
+        raise ValueError(f"Snapshots require string player ids, got {name!r}")
+    encoded = name.encode("utf-8")
+    if len(encoded) > 255:
+        raise ValueError(f"Player id too long for a snapshot (max 255 UTF-8 bytes): {name[:20]!r}...")
+    return struct.pack("<B", len(encoded)) + encoded
+
+def unpack_player_id(data, offset, kind):
+    """
+    Decode a player id written by pack_player_id.
+    
+    Args:
+        data (bytes): The snapshot.
+        offset (int): Position of the length byte.
+        kind (str): Snapshot kind named in the error message ("board" or "game").
+        
+    Returns:
+        tuple: (name, offset just past the id).
+        
+    Raises:
+        ValueError: If the id runs past the end of data or is not valid UTF-8.
+    """
+    if offset >= len(data) or offset + 1 + data[offset] > len(data):
+        raise ValueError(f"Truncated {kind} snapshot")
+    end = offset + 1 + data[offset]
+    return data[offset + 1:end].decode("utf-8"), end
+
+def _window_starts(combo_type, size):
+    """Return the ranges of valid (start_row, start_col) of windows in a direction."""
+    if combo_type == CombinationType.HORIZONTAL:
+        return range(size), range(size - 2)
+    if combo_type == CombinationType.VERTICAL:
+        return range(size - 2), range(size)
+    if combo_type == CombinationType.DIAGONAL_DOWN:
+        return range(size - 2), range(size - 2)
+    return range(2, size), range(size - 2)
+
 class Board:
     """Represents the game board for the Three for Ten game."""
     
@@ -31,17 +107,14 @@ class Board:
         self.card_used_in_combination = [[set() for _ in range(size)] for _ in range(size)]
         self.target_sum = 10
         self.ownership = [[None for _ in range(size)] for _ in range(size)]
-        self.player_colors = {
-            "Player 1": Fore.BLUE,
-            "AI Player": Fore.RED
-        }
-        self.default_color = Fore.WHITE
+        self._rebuild_empty_index()
 
     def place_card(self, row, col, card, player_name):
         """Place a card on the board at the specified position."""
         if self.is_valid_move(row, col):
             self.grid[row][col] = card
             self.ownership[row][col] = player_name
+            self._remove_empty(row, col)
             return True
         return False
 
@@ -53,7 +126,62 @@ class Board:
 
     def is_full(self):
         """Check if the board is completely filled."""
-        return all(cell is not None for row in self.grid for cell in row)
+        return not self._empty_cells
+
+    def empty_cells(self):
+        """Return the (row, col) positions of all empty cells, in no particular order."""
+        return list(self._empty_cells)
+
+    def random_empty_cell(self, rng=random):
+        """
+        Pick an empty cell uniformly at random.
+        
+        Args:
+            rng: Source of randomness with a random() method (default: the random module).
+            
+        Returns:
+            tuple: (row, col) of an empty cell, or None if the board is full.
+        """
+        if not self._empty_cells:
+            return None
+        return self._empty_cells[int(rng.random() * len(self._empty_cells))]
+
+    def copy(self):
+        """
+        Return an independent copy of the board.
+        
+        Cheaper than copy.deepcopy or a to_bytes round trip, and keeps player ids
+        of any type.
+        
+        Returns:
+            Board: The copy.
+        """
+        board = Board.__new__(Board)
+        board.size = self.size
+        board.target_sum = self.target_sum
+        board.grid = [list(row) for row in self.grid]
+        board.ownership = [list(row) for row in self.ownership]
+        board.card_used_in_combination = [[set(used) for used in row] for row in self.card_used_in_combination]
+        board.scored_combinations = {combo_type: set(keys) for combo_type, keys in self.scored_combinations.items()}
+        board._empty_cells = list(self._empty_cells)
+        board._empty_index = dict(self._empty_index)
+        return board
+
+    def _rebuild_empty_index(self):
+        """Rebuild the empty-cell index from the grid."""
+        self._empty_cells = [
+            (row, col) for row in range(self.size) for col in range(self.size)
+            if self.grid[row][col] is None
+        ]
+        self._empty_index = {position: i for i, position in enumerate(self._empty_cells)}
+
+    def _remove_empty(self, row, col):
+        """Drop a cell from the empty-cell index by swapping it with the last entry."""
+        i = self._empty_index.pop((row, col))
+        last = self._empty_cells.pop()
+        if i < len(self._empty_cells):
+            self._empty_cells[i] = last
+            self._empty_index[last] = i
 
     def check_combinations(self, player_id):
         """
@@ -157,81 +285,113 @@ class Board:
                 return True
         return False
 
+    def to_bytes(self):
+        """
+        Serialize the board state into a compact versioned snapshot.
+        
+        The snapshot holds the card values, ownership, used-direction marks and
+        scored windows. A 10x10 board fits in a few hundred bytes. Owners must
+        be string player ids of at most 255 UTF-8 bytes.
+        
+        Returns:
+            bytes: The encoded board.
+            
+        Raises:
+            ValueError: If an owner is not a string or is too long.
+        """
+        owners = []
+        owner_index = {None: 0}
+        for row in self.ownership:
+            for owner in row:
+                if owner not in owner_index:
+                    owner_index[owner] = len(owners) + 1
+                    owners.append(owner)
+        
+        parts = [_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.size, len(owners))]
+        for owner in owners:
+            parts.append(pack_player_id(owner))
+        parts.append(bytes(0 if cell is None else int(cell) for row in self.grid for cell in row))
+        parts.append(bytes(owner_index[owner] for row in self.ownership for owner in row))
+        parts.append(bytes(
+            direction_mask(used) for row in self.card_used_in_combination for used in row
+        ))
+        for combo_type in CombinationType:
+            keys = sorted(self.scored_combinations[combo_type])
+            parts.append(struct.pack("<H", len(keys)))
+            parts.append(bytes(value for key in keys for value in key))
+        return b"".join(parts)
+    
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Rebuild a board from a snapshot produced by to_bytes.
+        
+        Args:
+            data (bytes): The encoded board.
+            
+        Returns:
+            Board: The restored board.
+            
+        Raises:
+            ValueError: If data is not a complete board snapshot of a supported version.
+        """
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Truncated board snapshot")
+        magic, version, size, owner_count = _SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a board snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported board snapshot version: {version}")
+        offset = _SNAPSHOT_HEADER.size
+        
+        owners = [None]
+        for _ in range(owner_count):
+            owner, offset = unpack_player_id(data, offset, "board")
+            owners.append(owner)
+        
+        cell_count = size * size
+        if offset + 3 * cell_count > len(data):
+            raise ValueError("Truncated board snapshot")
+        values = data[offset:offset + cell_count]
+        owner_ids = data[offset + cell_count:offset + 2 * cell_count]
+        masks = data[offset + 2 * cell_count:offset + 3 * cell_count]
+        offset += 3 * cell_count
+        if cell_count and (max(values) > 8 or max(owner_ids) >= len(owners) or max(masks) >= len(_USED_BY_MASK)):
+            raise ValueError("Corrupt board snapshot: cell out of range")
+        if any(not value and (owner_id or mask) for value, owner_id, mask in zip(values, owner_ids, masks)):
+            raise ValueError("Corrupt board snapshot: empty cell with an owner or used directions")
+        
+        board = cls(size=size)
+        for row in range(size):
+            base = row * size
+            board.grid[row] = [_CARDS.get(value) for value in values[base:base + size]]
+            board.ownership[row] = [owners[owner_id] for owner_id in owner_ids[base:base + size]]
+            board.card_used_in_combination[row] = [set(_USED_BY_MASK[mask]) for mask in masks[base:base + size]]
+        for combo_type in CombinationType:
+            if offset + 2 > len(data):
+                raise ValueError("Truncated board snapshot")
+            (count,) = struct.unpack_from("<H", data, offset)
+            offset += 2
+            if offset + 2 * count > len(data):
+                raise ValueError("Truncated board snapshot")
+            keys = data[offset:offset + 2 * count]
+            scored = {(keys[i], keys[i + 1]) for i in range(0, 2 * count, 2)}
+            rows, cols = _window_starts(combo_type, size)
+            if any(start_row not in rows or start_col not in cols for start_row, start_col in scored):
+                raise ValueError("Corrupt board snapshot: scored window out of range")
+            board.scored_combinations[combo_type] = scored
+            offset += 2 * count
+        if offset != len(data):
+            raise ValueError("Trailing data after board snapshot")
+        board._rebuild_empty_index()
+        return board
+    
     def __str__(self):
         """Create an enhanced visual representation of the board."""
-        result = []
-        header = "    " + " ".join(f"{i:2}" for i in range(self.size))
-        result.append(header)
-        separator = "  +" + "-" * (3 * self.size + 1) + "+"
-        result.append(separator)
-        for i, row in enumerate(self.grid):
-            row_cells = []
-            for col, cell in enumerate(row):
-                if cell is None:
-                    row_cells.append("  ")
-                else:
-                    player_name = self.ownership[i][col]
-                    color = self.player_colors.get(player_name, self.default_color)
-                    card_str = str(cell)
-                    used_in = self.card_used_in_combination[i][col]
-                    if used_in:
-                        row_cells.append(f"{color}{Back.YELLOW}{card_str:2}{Style.RESET_ALL}")
-                    else:
-                        row_cells.append(f"{color}{card_str:2}{Style.RESET_ALL}")
-            row_str = f"{i:2}| " + " ".join(row_cells) + " |"
-            result.append(row_str)
-        result.append(separator)
-        return "\n".join(result)
+        from .render import render_board
+        return render_board(self)
     
     def highlight_combinations(self):
         """Display the board with highlighted scoring combinations."""
-        highlighted_grid = [row[:] for row in self.grid]
-        combination_grid = [[[] for _ in range(self.size)] for _ in range(self.size)]
-        for row in range(self.size):
-            for start_col in range(self.size - 2):
-                combo_key = (row, start_col)
-                if combo_key in self.scored_combinations[CombinationType.HORIZONTAL]:
-                    for i in range(3):
-                        combination_grid[row][start_col + i].append(CombinationType.HORIZONTAL)
-        for col in range(self.size):
-            for start_row in range(self.size - 2):
-                combo_key = (start_row, col)
-                if combo_key in self.scored_combinations[CombinationType.VERTICAL]:
-                    for i in range(3):
-                        combination_grid[start_row + i][col].append(CombinationType.VERTICAL)
-        for start_row in range(self.size - 2):
-            for start_col in range(self.size - 2):
-                combo_key = (start_row, start_col)
-                if combo_key in self.scored_combinations[CombinationType.DIAGONAL_DOWN]:
-                    for i in range(3):
-                        combination_grid[start_row + i][start_col + i].append(CombinationType.DIAGONAL_DOWN)
-        for start_row in range(2, self.size):
-            for start_col in range(self.size - 2):
-                combo_key = (start_row, start_col)
-                if combo_key in self.scored_combinations[CombinationType.DIAGONAL_UP]:
-                    for i in range(3):
-                        combination_grid[start_row - i][start_col + i].append(CombinationType.DIAGONAL_UP)
-        result = []
-        header = "    " + " ".join(f"{i:2}" for i in range(self.size))
-        result.append(header)
-        separator = "  +" + "-" * (3 * self.size + 1) + "+"
-        result.append(separator)
-        for i, row in enumerate(self.grid):
-            row_cells = []
-            for col, cell in enumerate(row):
-                if cell is None:
-                    row_cells.append("  ")
-                elif combination_grid[i][col]:
-                    player_name = self.ownership[i][col]
-                    color = self.player_colors.get(player_name, self.default_color)
-                    row_cells.append(f"{color}{Back.YELLOW}{cell:2}{Style.RESET_ALL}")
-                else:
-                    player_name = self.ownership[i][col]
-                    color = self.player_colors.get(player_name, self.default_color)
-                    row_cells.append(f"{color}{cell:2}{Style.RESET_ALL}")
-            row_str = f"{i:2}| " + " ".join(row_cells) + " |"
-            result.append(row_str)
-        result.append(separator)
-        result.append("\nLegend:")
-        result.append(f"{Back.YELLOW} # {Style.RESET_ALL}: Part of a scoring combination")
-        return "\n".join(result)
+        from .render import render_highlighted
+        return render_highlighted(self)
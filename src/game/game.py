@@ -1,12 +1,17 @@
 import os
+import struct
 import time
-from .board import Board
+from .board import Board, pack_player_id, unpack_player_id
 from .card import Card
 
+SNAPSHOT_MAGIC = b"3G"
+SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEADER = struct.Struct("<2sBBB")
+
 class Game:
     """Manages the Three for Ten game flow."""
     
-    def __init__(self, player1, player2, board_size):
+    def __init__(self, player1, player2, board_size, telemetry=None, headless=False):
         """
         Initialize a new game with the specified players.
         
@@ -14,10 +19,16 @@ class Game:
             player1: The first player.
             player2: The second player.
             board_size (int): The size of the game board.
+            telemetry: Optional utils.telemetry.Telemetry recording turn latencies and counters.
+            headless (bool): Skip screen clearing, game state printing and pauses.
         """
         self.board = Board(size=board_size)
+        self.telemetry = telemetry
+        self.headless = headless
         self.players = [player1, player2]
         self.current_player_idx = 0
+        self.history = []
+        self.last_scoring_time = 0.0
         self.scores = {player1.id: 0, player2.id: 0}
         player1.initialize_cards(range(1, 9))
         player2.initialize_cards(range(1, 9))
@@ -30,24 +41,76 @@ class Game:
             bool: True if the game continues, False if it's over.
         """
         current_player = self.players[self.current_player_idx]
-        os.system('cls' if os.name == 'nt' else 'clear')
-        self.print_game_state()
+        labels = {"player": current_player.id, "board_size": self.board.size}
+        
+        start = time.perf_counter()
+        if not self.headless:
+            os.system('cls' if os.name == 'nt' else 'clear')
+            self.print_game_state()
+        render_time = time.perf_counter() - start
+        
+        for player in self.players:
+            if player is not current_player and getattr(player, "ponder", False):
+                player.start_pondering(self.board, current_player.id)
+        
+        start = time.perf_counter()
         card, row, col = current_player.make_move(self.board)
-        if self.board.place_card(row, col, card, current_player.id):
-            points = self.board.check_combinations(current_player.id)
-            self.scores[current_player.id] += points
-            if points > 0:
+        decision_time = time.perf_counter() - start
+        
+        points = self.apply_move(card, row, col)
+        
+        if points is not None:
+            if points > 0 and not self.headless:
                 print(f"{current_player.id} scored {points} point(s)!")
                 print("\nScoring combinations:")
+                start = time.perf_counter()
                 print(self.board.highlight_combinations())
+                render_time += time.perf_counter() - start
+            if self.telemetry is not None:
+                self.telemetry.observe("render_seconds", render_time, **labels)
+                self.telemetry.observe("move_decision_seconds", decision_time, **labels)
+                self.telemetry.observe("scoring_seconds", self.last_scoring_time, **labels)
+                self.telemetry.increment("points_scored", points, **labels)
+                if self.board.is_full():
+                    self.telemetry.increment("games_played", board_size=self.board.size)
+            if points > 0 and not self.headless:
                 time.sleep(2)
-            self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
             return True
         else:
-            print(f"Invalid move by {current_player.id}: {card} at ({row}, {col})")
-            time.sleep(2)
+            if self.telemetry is not None:
+                self.telemetry.observe("render_seconds", render_time, **labels)
+                self.telemetry.observe("move_decision_seconds", decision_time, **labels)
+                self.telemetry.increment("invalid_moves", **labels)
+            if not self.headless:
+                print(f"Invalid move by {current_player.id}: {card} at ({row}, {col})")
+                time.sleep(2)
             return True
     
+    def apply_move(self, card, row, col):
+        """
+        Place a card for the current player, score it and pass the turn.
+        
+        The time spent in Board.check_combinations is kept in last_scoring_time.
+        
+        Args:
+            card: The card to place.
+            row (int): Row position.
+            col (int): Column position.
+            
+        Returns:
+            int: The points scored, or None if the move is invalid (the turn does not pass).
+        """
+        current_player = self.players[self.current_player_idx]
+        if not self.board.place_card(row, col, card, current_player.id):
+            return None
+        self.history.append((self.current_player_idx, int(card), row, col))
+        start = time.perf_counter()
+        points = self.board.check_combinations(current_player.id)
+        self.last_scoring_time = time.perf_counter() - start
+        self.scores[current_player.id] += points
+        self.current_player_idx = (self.current_player_idx + 1) % len(self.players)
+        return points
+    
     def is_game_over(self):
         """
         Check if the game is over.
@@ -86,6 +149,90 @@ class Game:
             return winners[0]
         return None
     
+    def to_record(self):
+        """
+        Describe the game as a plain dict suitable for utils.game_log.
+        
+        Returns:
+            dict: Board size, player ids, moves as [player_idx, value, row, col] and scores.
+        """
+        return {
+            "board_size": self.board.size,
+            "players": [player.id for player in self.players],
+            "moves": [list(move) for move in self.history],
+            "scores": [self.scores[player.id] for player in self.players]
+        }
+    
+    def snapshot(self):
+        """
+        Serialize the game state for checkpointing or hand-off to another process.
+        
+        Players are not serialized; only their ids and scores are, together
+        with the move history, the board and the index of the player to move. Player ids must be
+        strings of at most 255 UTF-8 bytes.
+        
+        Returns:
+            bytes: The encoded game state.
+            
+        Raises:
+            ValueError: If a player id is not a string or is too long.
+        """
+        parts = [_SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.current_player_idx, len(self.players))]
+        for player in self.players:
+            parts.append(pack_player_id(player.id))
+            parts.append(struct.pack("<i", self.scores[player.id]))
+        parts.append(struct.pack("<H", len(self.history)))
+        parts.append(bytes(value for move in self.history for value in move))
+        parts.append(self.board.to_bytes())
+        return b"".join(parts)
+    
+    def restore(self, data):
+        """
+        Restore a game state produced by snapshot.
+        
+        Args:
+            data (bytes): The encoded game state. Its player ids must match this game's players.
+                
+        Raises:
+            ValueError: If data is not a complete game snapshot of these players.
+        """
+        if len(data) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Truncated game snapshot")
+        magic, version, current_player_idx, player_count = _SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a game snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported game snapshot version: {version}")
+        if current_player_idx >= player_count:
+            raise ValueError("Corrupt game snapshot: current player out of range")
+        offset = _SNAPSHOT_HEADER.size
+        
+        scores = {}
+        for _ in range(player_count):
+            player_id, offset = unpack_player_id(data, offset, "game")
+            if offset + 4 > len(data):
+                raise ValueError("Truncated game snapshot")
+            (scores[player_id],) = struct.unpack_from("<i", data, offset)
+            offset += 4
+        if list(scores) != [player.id for player in self.players]:
+            raise ValueError(f"Snapshot players {list(scores)} do not match this game")
+        
+        if offset + 2 > len(data):
+            raise ValueError("Truncated game snapshot")
+        (move_count,) = struct.unpack_from("<H", data, offset)
+        offset += 2
+        moves = data[offset:offset + 4 * move_count]
+        if len(moves) != 4 * move_count:
+            raise ValueError("Truncated game snapshot")
+        offset += 4 * move_count
+        if any(moves[i] >= player_count for i in range(0, len(moves), 4)):
+            raise ValueError("Corrupt game snapshot: move by an unknown player")
+        
+        self.board = Board.from_bytes(data[offset:])
+        self.scores = {player.id: scores[player.id] for player in self.players}
+        self.current_player_idx = current_player_idx
+        self.history = [tuple(moves[i:i + 4]) for i in range(0, len(moves), 4)]
+    
     def print_game_state(self):
         """Print the current state of the game."""
         print("\n" + "=" * 30)
@@ -0,0 +1,98 @@
+import colorama
+from colorama import Fore, Back, Style
+from .board import CombinationType
+
+PLAYER_COLORS = {
+    "Player 1": Fore.BLUE,
+    "AI Player": Fore.RED
+}
+DEFAULT_COLOR = Fore.WHITE
+
+_initialized = False
+
+def _init_colorama():
+    """Initialize colorama the first time something is rendered."""
+    global _initialized
+    if not _initialized:
+        colorama.init(autoreset=True)
+        _initialized = True
+
+def render_board(board):
+    """Create an enhanced visual representation of the board."""
+    _init_colorama()
+    result = []
+    header = "    " + " ".join(f"{i:2}" for i in range(board.size))
+    result.append(header)
+    separator = "  +" + "-" * (3 * board.size + 1) + "+"
+    result.append(separator)
+    for i, row in enumerate(board.grid):
+        row_cells = []
+        for col, cell in enumerate(row):
+            if cell is None:
+                row_cells.append("  ")
+            else:
+                player_name = board.ownership[i][col]
+                color = PLAYER_COLORS.get(player_name, DEFAULT_COLOR)
+                card_str = str(cell)
+                used_in = board.card_used_in_combination[i][col]
+                if used_in:
+                    row_cells.append(f"{color}{Back.YELLOW}{card_str:2}{Style.RESET_ALL}")
+                else:
+                    row_cells.append(f"{color}{card_str:2}{Style.RESET_ALL}")
+        row_str = f"{i:2}| " + " ".join(row_cells) + " |"
+        result.append(row_str)
+    result.append(separator)
+    return "\n".join(result)
+
+def render_highlighted(board):
+    """Display the board with highlighted scoring combinations."""
+    _init_colorama()
+    combination_grid = [[[] for _ in range(board.size)] for _ in range(board.size)]
+    for row in range(board.size):
+        for start_col in range(board.size - 2):
+            combo_key = (row, start_col)
+            if combo_key in board.scored_combinations[CombinationType.HORIZONTAL]:
+                for i in range(3):
+                    combination_grid[row][start_col + i].append(CombinationType.HORIZONTAL)
+    for col in range(board.size):
+        for start_row in range(board.size - 2):
+            combo_key = (start_row, col)
+            if combo_key in board.scored_combinations[CombinationType.VERTICAL]:
+                for i in range(3):
+                    combination_grid[start_row + i][col].append(CombinationType.VERTICAL)
+    for start_row in range(board.size - 2):
+        for start_col in range(board.size - 2):
+            combo_key = (start_row, start_col)
+            if combo_key in board.scored_combinations[CombinationType.DIAGONAL_DOWN]:
+                for i in range(3):
+                    combination_grid[start_row + i][start_col + i].append(CombinationType.DIAGONAL_DOWN)
+    for start_row in range(2, board.size):
+        for start_col in range(board.size - 2):
+            combo_key = (start_row, start_col)
+            if combo_key in board.scored_combinations[CombinationType.DIAGONAL_UP]:
+                for i in range(3):
+                    combination_grid[start_row - i][start_col + i].append(CombinationType.DIAGONAL_UP)
+    result = []
+    header = "    " + " ".join(f"{i:2}" for i in range(board.size))
+    result.append(header)
+    separator = "  +" + "-" * (3 * board.size + 1) + "+"
+    result.append(separator)
+    for i, row in enumerate(board.grid):
+        row_cells = []
+        for col, cell in enumerate(row):
+            if cell is None:
+                row_cells.append("  ")
+            elif combination_grid[i][col]:
+                player_name = board.ownership[i][col]
+                color = PLAYER_COLORS.get(player_name, DEFAULT_COLOR)
+                row_cells.append(f"{color}{Back.YELLOW}{cell:2}{Style.RESET_ALL}")
+            else:
+                player_name = board.ownership[i][col]
+                color = PLAYER_COLORS.get(player_name, DEFAULT_COLOR)
+                row_cells.append(f"{color}{cell:2}{Style.RESET_ALL}")
+        row_str = f"{i:2}| " + " ".join(row_cells) + " |"
+        result.append(row_str)
+    result.append(separator)
+    result.append("\nLegend:")
+    result.append(f"{Back.YELLOW} # {Style.RESET_ALL}: Part of a scoring combination")
+    return "\n".join(result)
@@ -16,7 +16,7 @@ def main():
     input()
     
     player1 = HumanPlayer("Player 1")
-    player2 = SmartAIPlayer("Smart AI")
+    player2 = SmartAIPlayer("Smart AI", ponder=True)
     
     game = Game(player1, player2, board_size=board_size)
     
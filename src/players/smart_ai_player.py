@@ -1,8 +1,8 @@
 import random
+import threading
 import time
-import copy
 from game.card import Card
-from game.board import CombinationType
+from game.board import Board, CombinationType
 
 class SmartAIPlayer:
     """
@@ -10,15 +10,41 @@ class SmartAIPlayer:
     Uses plateau analysis and strategic card placement to maximize points.
     """
     
-    def __init__(self, name):
+    _COMBINATION_TYPES = {
+        "horizontal": CombinationType.HORIZONTAL,
+        "vertical": CombinationType.VERTICAL,
+        "diagonal_down": CombinationType.DIAGONAL_DOWN,
+        "diagonal_up": CombinationType.DIAGONAL_UP
+    }
+    
+    # Every cell of a board size, most central first; shared by all instances.
+    _CENTER_ORDER = {}
+    
+    def __init__(self, name, position_store=None, ponder=False, think_delay=1.5, time_budget_ms=None):
         """
         Initialize a new AI player.
         
         Args:
             name (str): The name of the player.
+            position_store: Optional utils.position_store.PositionStore probed before searching.
+            ponder (bool): Precompute replies in the background during the opponent's turn.
+            think_delay (float): Seconds to pause before searching, for console play (default 1.5).
+            time_budget_ms (float): Per-move deadline in milliseconds. When set, the search
+                returns the best candidate found when the deadline passes and the think
+                delay is skipped (default: no deadline).
         """
         self.id = name
+        self.think_delay = think_delay
+        self.time_budget_ms = time_budget_ms
+        self.last_search = {}
         self.available_values = []
+        self.position_store = position_store
+        self.ponder = ponder
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+        self._ponder_cache = {}
+        self._ponder_stop = None
+        self._ponder_thread = None
     
     def initialize_cards(self, card_values):
         """
@@ -56,36 +82,133 @@ class SmartAIPlayer:
         """
         print(f"\n{self.id} is thinking strategically...")
         
-        empty_positions = []
-        for row in range(board.size):
-            for col in range(board.size):
-                if board.is_valid_move(row, col):
-                    empty_positions.append((row, col))
+        start = time.perf_counter()
+        deadline = None if self.time_budget_ms is None else start + self.time_budget_ms / 1000
+        empty_positions = board.empty_cells()
         
         if not empty_positions:
             raise ValueError("No valid moves available!")
         
-        time.sleep(1.5)
+        pondered_move = self._take_pondered_move(board)
+        if pondered_move is not None:
+            card, row, col = pondered_move
+            print(f"{self.id} plays {card} at position ({row}, {col})")
+            return card, row, col
         
-        best_move = self._find_best_move(board, empty_positions)
+        best_move = self._probe_position_store(board)
+        if best_move is None:
+            if self.think_delay and deadline is None:
+                time.sleep(self.think_delay)
+            search = {}
+            best_move = self._find_best_move(board, empty_positions, deadline, search)
+            search["elapsed_ms"] = (time.perf_counter() - start) * 1000
+            self.last_search = search
+            if self.position_store is not None and search["coverage"] == 1.0:
+                card, row, col = best_move
+                self.position_store.put(self._position_key(board), int(card), row, col, score=search["score"])
+        if self.position_store is not None and len(empty_positions) <= 2:
+            # This is our last move of the game: make its positions durable for the next run.
+            self.position_store.flush()
         card, row, col = best_move
         
         if not board.is_valid_move(row, col):
             print(f"AI attempted invalid move, choosing a random move instead")
-            row, col = random.choice(empty_positions)
+            row, col = board.random_empty_cell()
             value = random.choice(self.available_values)
             card = Card(value)
         
         print(f"{self.id} plays {card} at position ({row}, {col})")
         return card, row, col
     
-    def _find_best_move(self, board, empty_positions):
+    def start_pondering(self, board, opponent_id):
+        """
+        Start precomputing replies to the opponent's likely moves on a background thread.
+        
+        Args:
+            board: The board the opponent is about to move on.
+            opponent_id: The id of the player to move.
+        """
+        self.stop_pondering()
+        self._ponder_cache = {}
+        self._ponder_stop = threading.Event()
+        self._ponder_thread = threading.Thread(
+            target=self._ponder,
+            args=(board.to_bytes(), opponent_id, self._ponder_cache, self._ponder_stop),
+            daemon=True
+        )
+        self._ponder_thread.start()
+    
+    def stop_pondering(self):
+        """Stop the background pondering thread, keeping the replies computed so far."""
+        if self._ponder_thread is not None:
+            self._ponder_stop.set()
+            self._ponder_thread.join()
+            self._ponder_thread = None
+    
+    def _ponder(self, snapshot, opponent_id, cache, stop):
+        """
+        Evaluate the opponent's candidate moves, most promising first, and cache the best reply to each.
+        
+        Args:
+            snapshot (bytes): Board.to_bytes of the position the opponent moves on
+            opponent_id: The id of the player to move
+            cache (dict): Maps the snapshot of each resulting position to the reply
+            stop (threading.Event): Set when the opponent's move has arrived
+        """
+        board = Board.from_bytes(snapshot)
+        for row, col, values in self._generate_candidates(board, board.empty_cells(), stop=stop):
+            for value in values:
+                if stop.is_set():
+                    return
+                position = Board.from_bytes(snapshot)
+                position.place_card(row, col, Card(value), opponent_id)
+                position.check_combinations(opponent_id)
+                if position.is_full():
+                    continue
+                search = {}
+                move = self._find_best_move(position, position.empty_cells(), stats=search, stop=stop)
+                if search["coverage"] == 1.0:
+                    cache[position.to_bytes()] = move
+    
+    def _take_pondered_move(self, board):
+        """
+        Stop pondering and return the precomputed reply to the current position, if any.
+        
+        Args:
+            board: The game board
+            
+        Returns:
+            tuple: (card, row, col) of the cached reply, or None on a miss
+        """
+        if self._ponder_thread is None and not self._ponder_cache:
+            return None
+        self.stop_pondering()
+        move = self._ponder_cache.get(board.to_bytes())
+        self._ponder_cache = {}
+        if move is None or not board.is_valid_move(move[1], move[2]):
+            self.ponder_misses += 1
+            return None
+        self.ponder_hits += 1
+        return move
+    
+    def _find_best_move(self, board, empty_positions, deadline=None, stats=None, stop=None):
         """
         Find the best move based on heuristic analysis.
         
+        Candidates are evaluated most promising first, so when a deadline cuts the
+        search short the best move found so far is still a good one. Candidate
+        generation gets at most half of the remaining time, and no evaluation is
+        started unless the slowest one so far would still finish in time. If none
+        fits, the top candidate is played unevaluated.
+        
         Args:
             board: The current game board
             empty_positions: List of available positions
+            deadline: time.perf_counter() value after which to stop searching (default: none)
+            stats: Optional dict filled with the generation time, the number of candidates,
+                how many were evaluated, the share of the full search that was done
+                (coverage) and the heuristic score of the chosen move (None if unevaluated)
+            stop: Optional threading.Event that cuts the search short when set
             
         Returns:
             tuple: (card, row, col) representing the best move
@@ -93,25 +216,236 @@ class SmartAIPlayer:
         best_score = float('-inf')
         best_move = None
         
-        for row, col in empty_positions:
-            for value in self.available_values:
-                card = Card(value)
-                score = self._evaluate_move(board, card, row, col)
-                if score > best_score:
-                    best_score = score
-                    best_move = (card, row, col)
+        start = time.perf_counter()
+        generation_deadline = None if deadline is None else start + (deadline - start) / 2
+        generation = {}
+        candidates = self._generate_candidates(board, empty_positions, generation_deadline, stop, generation)
+        generation_ms = (time.perf_counter() - start) * 1000
+        
+        evaluated = 0
+        slowest = 0.0
+        for row, col, values in candidates:
+            now = time.perf_counter()
+            if (deadline is not None and now + slowest >= deadline) or (stop is not None and stop.is_set()):
+                break
+            card = Card(random.choice(values))
+            score = self._evaluate_move(board, card, row, col)
+            evaluated += 1
+            slowest = max(slowest, time.perf_counter() - now)
+            if score > best_score:
+                best_score = score
+                best_move = (card, row, col)
+        
+        if stats is not None:
+            coverage = evaluated / len(candidates) if candidates else 1.0
+            if empty_positions:
+                coverage *= generation["analyzed"] / len(empty_positions)
+            stats["generation_ms"] = generation_ms
+            stats["candidates"] = len(candidates)
+            stats["evaluated"] = evaluated
+            stats["coverage"] = coverage
+            stats["score"] = best_score if best_move is not None else None
+        
+        if best_move is None and candidates:
+            row, col, values = candidates[0]
+            best_move = (Card(random.choice(values)), row, col)
         
         if best_move is None:
-            row, col = random.choice(empty_positions)
+            row, col = board.random_empty_cell()
             value = random.choice(self.available_values)
             best_move = (Card(value), row, col)
             
         return best_move
     
+    def _position_key(self, board):
+        """Return the position store key of the board as seen by this player."""
+        return self.position_store.position_key(board, self.id, namespace=type(self).__name__)
+    
+    def _probe_position_store(self, board):
+        """
+        Look up the current position in the position store.
+        
+        Args:
+            board: The game board
+            
+        Returns:
+            tuple: (card, row, col) of the stored move, or None if there is no usable entry
+        """
+        if self.position_store is None:
+            return None
+        key = self._position_key(board)
+        entry = self.position_store.get(key)
+        if entry is None:
+            return None
+        value, row, col, _ = entry
+        if not board.is_valid_move(row, col) or value not in self.available_values:
+            self.position_store.reject(key)
+            return None
+        return (Card(value), row, col)
+    
+    def _generate_candidates(self, board, empty_positions, deadline=None, stop=None, stats=None):
+        """
+        Group the card values of each empty cell into classes with identical heuristic effect.
+        
+        Two values are equivalent at a cell when they complete the same number of
+        windows and leave the same number of near-complete windows, which is all
+        the value-dependent part of _evaluate_move looks at. Candidates are ordered
+        by immediate points, then windows the opponent could complete through the
+        cell, then near-complete windows and centrality.
+        
+        Cells are analyzed in _prioritize_cells order. Once the deadline passes (or
+        stop is set), the remaining cells are not analyzed: each becomes a single
+        candidate holding every value, kept in that order after the analyzed ones.
+        
+        Args:
+            board: The game board
+            empty_positions: List of available positions
+            deadline: time.perf_counter() value after which to stop analyzing cells (default: none)
+            stop: Optional threading.Event with the same effect as the deadline
+            stats: Optional dict filled with the number of analyzed cells
+            
+        Returns:
+            list: (row, col, values) tuples, most promising first
+        """
+        candidates = []
+        skipped = []
+        ordered = self._prioritize_cells(board, empty_positions)
+        
+        for index, (row, col) in enumerate(ordered):
+            if ((deadline is not None and time.perf_counter() >= deadline) or
+                    (stop is not None and stop.is_set())):
+                skipped = ordered[index:]
+                break
+            complete_sums = []
+            open_sums = []
+            blocks = 0
+            for direction, positions in self._windows_through(board, row, col):
+                others = [(r, c) for r, c in positions if (r, c) != (row, col)]
+                filled = [(r, c) for r, c in others if board.grid[r][c] is not None]
+                partial_sum = sum(int(board.grid[r][c]) for r, c in filled)
+                if len(filled) == 2:
+                    combo_type = self._COMBINATION_TYPES[direction]
+                    if not any(combo_type in board.card_used_in_combination[r][c] for r, c in filled):
+                        complete_sums.append(partial_sum)
+                        if (all(board.ownership[r][c] != self.id for r, c in filled) and
+                                1 <= 10 - partial_sum <= 8):
+                            blocks += 1
+                elif len(filled) == 1:
+                    open_sums.append(partial_sum)
+            
+            classes = {}
+            for value in self.available_values:
+                points = sum(1 for s in complete_sums if s + value == 10)
+                future = sum(1 for s in open_sums if 1 <= 10 - s - value <= 8)
+                classes.setdefault((points, future), []).append(value)
+            
+            positional_value = self._evaluate_position(board, row, col)
+            for (points, future), values in classes.items():
+                estimate = points * 100 + blocks * 75 + future * 50 + positional_value * 20
+                candidates.append((estimate, row, col, values))
+        
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        if stats is not None:
+            stats["analyzed"] = len(empty_positions) - len(skipped)
+        return ([(row, col, values) for _, row, col, values in candidates] +
+                [(row, col, self.available_values) for row, col in skipped])
+    
+    def _prioritize_cells(self, board, empty_positions):
+        """
+        Order empty cells for analysis, cheaply enough to run under a time budget.
+        
+        Cells in windows that already hold two cards come first, then cells in
+        windows holding one card, then the rest; ties are broken by centrality.
+        Only windows through filled cells are visited, so this is fast on an
+        empty board.
+        
+        Args:
+            board: The game board
+            empty_positions: List of available positions
+            
+        Returns:
+            list: The empty positions, most promising first
+        """
+        size = board.size
+        window_cards = {}
+        for row in range(size):
+            for col, cell in enumerate(board.grid[row]):
+                if cell is None:
+                    continue
+                for step_row, step_col in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+                    for k in range(3):
+                        start_row, start_col = row - k * step_row, col - k * step_col
+                        end_row, end_col = start_row + 2 * step_row, start_col + 2 * step_col
+                        if 0 <= min(start_row, end_row) and max(start_row, end_row) < size and \
+                                0 <= start_col and end_col < size:
+                            window = (start_row, start_col, step_row, step_col)
+                            window_cards[window] = window_cards.get(window, 0) + 1
+        
+        near = {}
+        for (start_row, start_col, step_row, step_col), cards in window_cards.items():
+            if cards == 3:
+                continue
+            for k in range(3):
+                position = (start_row + k * step_row, start_col + k * step_col)
+                if board.grid[position[0]][position[1]] is None:
+                    twos, ones = near.get(position, (0, 0))
+                    near[position] = (twos + 1, ones) if cards == 2 else (twos, ones + 1)
+        
+        center_order = self._CENTER_ORDER.get(size)
+        if center_order is None:
+            center = size // 2
+            center_order = self._CENTER_ORDER[size] = sorted(
+                ((row, col) for row in range(size) for col in range(size)),
+                key=lambda position: abs(position[0] - center) + abs(position[1] - center)
+            )
+        rank = {}
+        empty = set(empty_positions)
+        ordered = [position for position in center_order if position in empty]
+        for i, position in enumerate(ordered):
+            if position in near:
+                rank[position] = i
+        touched = sorted(rank, key=lambda position: (-near[position][0], -near[position][1], rank[position]))
+        return touched + [position for position in ordered if position not in near]
+    
+    def _windows_through(self, board, row, col):
+        """
+        List every 3-card window on the board that contains (row, col).
+        
+        Args:
+            board: The game board
+            row: Row position
+            col: Column position
+            
+        Returns:
+            list: (direction, positions) tuples
+        """
+        windows = []
+        
+        for start_col in range(max(0, col - 2), min(col + 1, board.size - 2)):
+            windows.append(("horizontal", [(row, start_col + i) for i in range(3)]))
+        
+        for start_row in range(max(0, row - 2), min(row + 1, board.size - 2)):
+            windows.append(("vertical", [(start_row + i, col) for i in range(3)]))
+        
+        for offset in range(-2, 1):
+            start_row = row + offset
+            start_col = col + offset
+            if (0 <= start_row < board.size - 2 and 
+                0 <= start_col < board.size - 2):
+                windows.append(("diagonal_down", [(start_row + i, start_col + i) for i in range(3)]))
+        
+        for offset in range(-2, 1):
+            start_row = row - offset
+            start_col = col + offset
+            if (2 <= start_row < board.size and 
+                0 <= start_col < board.size - 2):
+                windows.append(("diagonal_up", [(start_row - i, start_col + i) for i in range(3)]))
+        
+        return windows
+    
     def _copy_board(self, board):
-        """Create a deep copy of the board for move simulation."""
-        board_copy = copy.deepcopy(board)
-        return board_copy
+        """Create a copy of the board for move simulation."""
+        return board.copy()
     
     def _evaluate_move(self, board, card, row, col):
         """
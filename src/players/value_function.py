@@ -0,0 +1,263 @@
+import argparse
+import json
+import os
+import random
+import numpy as np
+from game.board import Board, CombinationType, DIRECTION_BITS, direction_mask
+from game.card import Card
+
+WEIGHTS_VERSION = 1
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "value_function.json")
+
+FEATURE_NAMES = [
+    "bias",
+    "points",
+    "creates_open",
+    "blocks_open",
+    "open_after",
+    "empty_fraction_after",
+    "empty_parity_after",
+    "centrality"
+]
+
+_WINDOW_TABLES = {}
+
+def _window_table(size):
+    """
+    Build (and cache) the 3-card windows of a board size.
+
+    Returns:
+        tuple: (cells, bits, incidence) where cells is a (W, 3) array of flat cell
+        indices, bits the direction bit of each window and incidence a (N, W)
+        matrix with a 1 where a cell belongs to a window.
+    """
+    if size not in _WINDOW_TABLES:
+        windows = []
+        for row in range(size):
+            for col in range(size):
+                if col + 2 < size:
+                    windows.append(([(row, col + i) for i in range(3)], CombinationType.HORIZONTAL))
+                if row + 2 < size:
+                    windows.append(([(row + i, col) for i in range(3)], CombinationType.VERTICAL))
+                if row + 2 < size and col + 2 < size:
+                    windows.append(([(row + i, col + i) for i in range(3)], CombinationType.DIAGONAL_DOWN))
+                if row >= 2 and col + 2 < size:
+                    windows.append(([(row - i, col + i) for i in range(3)], CombinationType.DIAGONAL_UP))
+        cells = np.array([[r * size + c for r, c in positions] for positions, _ in windows], dtype=np.intp)
+        bits = np.array([DIRECTION_BITS[combo_type] for _, combo_type in windows], dtype=np.int64)
+        incidence = np.zeros((size * size, len(windows)))
+        for w, window_cells in enumerate(cells):
+            incidence[window_cells, w] = 1.0
+        _WINDOW_TABLES[size] = (cells, bits, incidence)
+    return _WINDOW_TABLES[size]
+
+def candidate_features(board, values):
+    """
+    Compute the features of every (empty cell, card value) move in one pass.
+
+    A window is "open" when it holds two unused cards and the missing card is
+    between 1 and 8, i.e. whoever moves next can complete it.
+
+    Args:
+        board: The game board.
+        values: The card values that may be played.
+
+    Returns:
+        tuple: (moves, features) where moves is a list of (value, row, col) and
+        features a (len(moves), len(FEATURE_NAMES)) array.
+    """
+    size = board.size
+    cells, bits, incidence = _window_table(size)
+    grid = np.array([0 if cell is None else int(cell) for row in board.grid for cell in row], dtype=np.int64)
+    used = np.array([direction_mask(used_in) for row in board.card_used_in_combination for used_in in row], dtype=np.int64)
+    values = np.asarray(list(values), dtype=np.int64)
+    empty = np.array([row * size + col for row, col in sorted(board.empty_cells())], dtype=np.intp)
+
+    window_values = grid[cells]
+    filled = (window_values > 0).sum(axis=1)
+    partial_sum = window_values.sum(axis=1)
+    usable = ~((used[cells] & bits[:, None]) != 0).any(axis=1)
+    missing = 10 - partial_sum
+    open_now = usable & (filled == 2) & (missing >= 1) & (missing <= 8)
+
+    completes = (usable & (filled == 2))[:, None] & (partial_sum[:, None] + values[None, :] == 10)
+    still_missing = missing[:, None] - values[None, :]
+    creates_open = (usable & (filled == 1))[:, None] & (still_missing >= 1) & (still_missing <= 8)
+    blocks_open = open_now[:, None] & ~completes
+
+    # A card can score at most once per direction, and once it has scored no
+    # other window through it in that direction can be completed later.
+    through = incidence[empty]
+    points = np.zeros((len(empty), len(values)))
+    created = np.zeros((len(empty), len(values)))
+    for bit in DIRECTION_BITS.values():
+        in_direction = through * (bits == bit)
+        scores = np.minimum(in_direction @ completes, 1.0)
+        points += scores
+        created += (in_direction @ creates_open) * (1.0 - scores)
+    blocked = through @ blocks_open
+    open_after = open_now.sum() - (through @ open_now)[:, None] + created
+
+    count = len(empty)
+    shape = (count, len(values))
+    rows, cols = np.divmod(empty, size)
+    center = size // 2
+    centrality = 1.0 - (np.abs(rows - center) + np.abs(cols - center)) / (2 * center)
+    features = np.stack([
+        np.ones(shape),
+        points,
+        created,
+        blocked,
+        open_after,
+        np.full(shape, (count - 1) / (size * size)),
+        np.full(shape, (count - 1) % 2),
+        np.broadcast_to(centrality[:, None], shape)
+    ], axis=-1).reshape(-1, len(FEATURE_NAMES))
+    moves = [(int(value), int(row), int(col)) for row, col in zip(rows, cols) for value in values]
+    return moves, features
+
+class ValueFunction:
+    """Linear model predicting the score differential a move leads to, from the mover's point of view."""
+
+    def __init__(self, weights):
+        """
+        Initialize the model.
+
+        Args:
+            weights: One weight per entry of FEATURE_NAMES.
+        """
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+    def predict(self, features):
+        """Score a batch of feature rows with a single matrix product."""
+        return features @ self.weights
+
+    def save(self, path):
+        """
+        Write the weights to a versioned JSON file.
+
+        Args:
+            path (str): Destination file.
+        """
+        with open(path, "w") as f:
+            json.dump({
+                "version": WEIGHTS_VERSION,
+                "features": FEATURE_NAMES,
+                "weights": self.weights.tolist()
+            }, f, indent=2)
+            f.write("\n")
+
+    @classmethod
+    def load(cls, path=DEFAULT_WEIGHTS_PATH):
+        """
+        Read weights written by save.
+
+        Args:
+            path (str): Weights file (default: value_function.json next to this module).
+
+        Returns:
+            ValueFunction: The loaded model.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != WEIGHTS_VERSION:
+            raise ValueError(f"Unsupported value function version: {data.get('version')}")
+        if data.get("features") != FEATURE_NAMES:
+            raise ValueError("Value function features do not match this version of the game")
+        return cls(data["weights"])
+
+# Greedy weights used to bootstrap self-play before any model is trained.
+BOOTSTRAP = ValueFunction([0.0, 1.0, -0.5, 0.3, -0.2, 0.0, 0.0, 0.05])
+
+def self_play(games, board_size, value_function=BOOTSTRAP, epsilon=0.1, rng=None):
+    """
+    Play headless games and label every move with the score differential it led to.
+
+    Moves are chosen greedily by value_function, or uniformly at random with
+    probability epsilon. The label of a move is the mover's points from that
+    move to the end of the game minus the opponent's points over the same span.
+
+    Args:
+        games (int): Number of games to play.
+        board_size (int): Size of the board.
+        value_function (ValueFunction): Policy used to pick moves.
+        epsilon (float): Probability of a random move.
+        rng (random.Random): Source of randomness.
+
+    Yields:
+        tuple: (features, label) for every move played.
+    """
+    rng = rng or random.Random()
+    values = range(1, 9)
+    for _ in range(games):
+        board = Board(size=board_size)
+        history = []
+        scores = [0, 0]
+        mover = 0
+        while not board.is_full():
+            moves, features = candidate_features(board, values)
+            if rng.random() < epsilon:
+                choice = rng.randrange(len(moves))
+            else:
+                predictions = value_function.predict(features)
+                best = np.flatnonzero(predictions >= predictions.max() - 1e-9)
+                choice = int(best[rng.randrange(len(best))])
+            value, row, col = moves[choice]
+            history.append((features[choice], mover, list(scores)))
+            board.place_card(row, col, Card(value), mover)
+            scores[mover] += board.check_combinations(mover)
+            mover = 1 - mover
+        for features, player, before in history:
+            gained = [scores[i] - before[i] for i in range(2)]
+            yield features, gained[player] - gained[1 - player]
+
+def train(samples, l2=1.0):
+    """
+    Fit a ridge regression on (features, label) samples.
+
+    Args:
+        samples: Iterable of (features, label) pairs, e.g. from self_play.
+        l2 (float): Ridge penalty on the standardized features (default 1.0).
+
+    Returns:
+        ValueFunction: The fitted model.
+    """
+    features, labels = zip(*samples)
+    X = np.asarray(features)
+    y = np.asarray(labels, dtype=np.float64)
+    mean = X[:, 1:].mean(axis=0)
+    std = X[:, 1:].std(axis=0)
+    std[std == 0] = 1.0
+    Z = np.hstack([np.ones((len(X), 1)), (X[:, 1:] - mean) / std])
+    penalty = l2 * np.eye(Z.shape[1])
+    penalty[0, 0] = 0.0
+    beta = np.linalg.solve(Z.T @ Z + penalty, Z.T @ y)
+    weights = np.concatenate([[beta[0] - np.sum(beta[1:] * mean / std)], beta[1:] / std])
+    return ValueFunction(weights)
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the value function from headless self-play.")
+    parser.add_argument("--games", type=int, default=400, help="games per board size and round")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 6, 7, 8], help="board sizes to play on")
+    parser.add_argument("--rounds", type=int, default=2, help="self-play rounds, each using the previous model")
+    parser.add_argument("--epsilon", type=float, default=0.1, help="probability of a random move")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=DEFAULT_WEIGHTS_PATH)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    model = BOOTSTRAP
+    for round_number in range(args.rounds):
+        samples = [
+            sample for size in args.sizes
+            for sample in self_play(args.games, size, model, args.epsilon, rng)
+        ]
+        model = train(samples)
+        print(f"Round {round_number + 1}: {len(samples)} positions")
+        for name, weight in zip(FEATURE_NAMES, model.weights):
+            print(f"  {name:>22}: {weight:+.4f}")
+    model.save(args.out)
+    print(f"Saved weights to {args.out}")
+
+if __name__ == "__main__":
+    main()
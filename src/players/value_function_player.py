@@ -0,0 +1,74 @@
+import random
+import numpy as np
+from game.card import Card
+from players.value_function import DEFAULT_WEIGHTS_PATH, ValueFunction, candidate_features
+
+class ValueFunctionPlayer:
+    """
+    An AI player that scores every candidate move with a learned value function.
+    All candidates are evaluated together in a single matrix product.
+    """
+
+    _models = {}
+
+    def __init__(self, name, weights_path=DEFAULT_WEIGHTS_PATH):
+        """
+        Initialize a new value function player.
+
+        Args:
+            name (str): The name of the player.
+            weights_path (str): Weights file written by players.value_function (loaded once per path).
+        """
+        self.id = name
+        self.available_values = []
+        if weights_path not in self._models:
+            self._models[weights_path] = ValueFunction.load(weights_path)
+        self.value_function = self._models[weights_path]
+
+    def initialize_cards(self, card_values):
+        """
+        Set up the available card values for the player.
+
+        Args:
+            card_values: Range or list of available values.
+        """
+        self.available_values = list(card_values)
+
+    def has_cards(self):
+        """
+        With unlimited cards, this method always returns True.
+
+        Returns:
+            bool: Always True since players have unlimited cards.
+        """
+        return True
+
+    def remove_card(self, card):
+        """
+        With unlimited cards, this method doesn't need to do anything.
+        """
+        pass
+
+    def make_move(self, board):
+        """
+        Determine the move with the highest predicted score differential.
+
+        Args:
+            board: The game board.
+
+        Returns:
+            tuple: (card, row, col) representing the AI's move.
+        """
+        print(f"\n{self.id} is thinking strategically...")
+
+        if board.is_full():
+            raise ValueError("No valid moves available!")
+
+        moves, features = candidate_features(board, self.available_values)
+        predictions = self.value_function.predict(features)
+        best = np.flatnonzero(predictions >= predictions.max() - 1e-9)
+        value, row, col = moves[int(random.choice(best))]
+        card = Card(value)
+
+        print(f"{self.id} plays {card} at position ({row}, {col})")
+        return card, row, col
@@ -0,0 +1,4 @@
+from ui.pygame_frontend import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+import contextlib
+import io
+import math
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pygame
+from game.board import Board
+from game.card import Card
+from game.game import Game
+from players.human_player import HumanPlayer
+
+BACKGROUND = (30, 30, 38)
+GRID_LINE = (70, 70, 84)
+EMPTY_CELL = (46, 46, 58)
+HOVER_OUTLINE = (200, 200, 220)
+SCORED_CELL = (214, 182, 48)
+TEXT = (235, 235, 240)
+PLAYER_COLORS = [(80, 150, 255), (240, 90, 80)]
+
+STATUS_HEIGHT = 64
+PALETTE_HEIGHT = 64
+MARGIN = 16
+
+def _decide(player, snapshot):
+    """Run a player's decision on a copy of the board; executed on the AI worker thread."""
+    card, row, col = player.make_move(Board.from_bytes(snapshot))
+    return int(card), row, col
+
+def _decide_quietly(player, snapshot):
+    """Like _decide, with the player's console output discarded; executed in the AI worker process."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return _decide(player, snapshot)
+
+class PygameFrontend:
+    """
+    pygame window for the Three for Ten game.
+
+    Only the parts of the screen that changed are redrawn and pushed to the
+    display. AI players decide on a worker thread (or process) so the window
+    keeps its frame rate while they think; HumanPlayer instances are played
+    with the mouse and the 1-8 keys.
+    """
+
+    def __init__(self, game, fps=60, ai_in_process=False):
+        """
+        Initialize the window.
+
+        Args:
+            game (Game): The game to display and drive.
+            fps (int): Target frame rate (default 60).
+            ai_in_process (bool): Run AI decisions in a separate process instead of a thread.
+                The players are then pickled for every decision, so pondering is not used.
+        """
+        pygame.init()
+        self.game = game
+        self.fps = fps
+        size = game.board.size
+        self.cell = max(32, min(64, 560 // size))
+        width = 2 * MARGIN + size * self.cell
+        height = STATUS_HEIGHT + 2 * MARGIN + size * self.cell + PALETTE_HEIGHT
+        self.screen = pygame.display.set_mode((max(width, 8 * 44 + 2 * MARGIN), height))
+        pygame.display.set_caption("3 pour 10")
+        self.font = pygame.font.Font(None, max(24, self.cell * 3 // 5))
+        self.small_font = pygame.font.Font(None, 26)
+        self.clock = pygame.time.Clock()
+        self.executor = ProcessPoolExecutor(max_workers=1) if ai_in_process else ThreadPoolExecutor(max_workers=1)
+        self.ai_in_process = ai_in_process
+
+        self.board_origin = (MARGIN, STATUS_HEIGHT + MARGIN)
+        self.palette_top = STATUS_HEIGHT + 2 * MARGIN + size * self.cell
+        self.selected_value = 5
+        self.hover = None
+        self.message = ""
+        self.pending = None
+        self.turn_started = False
+        self.running = True
+        self.frames = 0
+
+        self._drawn_cells = {}
+        self._drawn_moves = None
+        self._drawn_hover = None
+        self._drawn_status = None
+        self._drawn_palette = None
+        self._dirty = []
+        self._full_redraw = True
+
+    def run(self, max_frames=None):
+        """
+        Run the event loop until the window is closed.
+
+        Args:
+            max_frames (int): Stop after this many frames (default: run until closed).
+        """
+        try:
+            while self.running and (max_frames is None or self.frames < max_frames):
+                self.run_frame()
+                self.clock.tick(self.fps)
+        finally:
+            self.close()
+
+    def run_frame(self):
+        """Process events, advance the game and redraw what changed, once."""
+        for event in pygame.event.get():
+            self._handle_event(event)
+        self._advance()
+        self._draw()
+        self.frames += 1
+
+    def close(self):
+        """Stop the AI worker and close the window."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        pygame.quit()
+
+    def _current_player(self):
+        return self.game.players[self.game.current_player_idx]
+
+    def _handle_event(self, event):
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif event.type == pygame.KEYDOWN and pygame.K_1 <= event.key <= pygame.K_8:
+            self.selected_value = event.key - pygame.K_0
+        elif event.type == pygame.MOUSEMOTION:
+            self.hover = self._cell_at(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            value = self._palette_value_at(event.pos)
+            if value is not None:
+                self.selected_value = value
+                return
+            cell = self._cell_at(event.pos)
+            player = self._current_player()
+            if cell is not None and isinstance(player, HumanPlayer) and not self.game.is_game_over():
+                self._play(Card(self.selected_value), *cell)
+
+    def _advance(self):
+        """Start or collect AI decisions and announce the turn."""
+        if self.game.is_game_over():
+            if self.pending is None and not self.message.startswith("Game over"):
+                winner = self.game.get_winner()
+                self.message = f"Game over: {winner.id} wins!" if winner else "Game over: it's a tie!"
+            return
+        player = self._current_player()
+        if not self.turn_started:
+            self.turn_started = True
+            if isinstance(player, HumanPlayer):
+                for other in self.game.players:
+                    if other is not player and getattr(other, "ponder", False) and not self.ai_in_process:
+                        other.start_pondering(self.game.board, player.id)
+            else:
+                decide = _decide_quietly if self.ai_in_process else _decide
+                self.pending = self.executor.submit(decide, player, self.game.board.to_bytes())
+        if self.pending is not None and self.pending.done():
+            value, row, col = self.pending.result()
+            self.pending = None
+            self._play(Card(value), row, col)
+
+    def _play(self, card, row, col):
+        player = self._current_player()
+        points = self.game.apply_move(card, row, col)
+        if points is None:
+            self.message = f"({row}, {col}) is already occupied!"
+            if not isinstance(player, HumanPlayer):
+                self.turn_started = False
+            return
+        self.turn_started = False
+        self.message = f"{player.id} scored {points} point(s)!" if points else f"{player.id} played {card} at ({row}, {col})"
+
+    def _cell_at(self, pos):
+        x, y = pos[0] - self.board_origin[0], pos[1] - self.board_origin[1]
+        size = self.game.board.size
+        if 0 <= x < size * self.cell and 0 <= y < size * self.cell:
+            return int(y // self.cell), int(x // self.cell)
+        return None
+
+    def _palette_value_at(self, pos):
+        for value in range(1, 9):
+            if self._palette_rect(value).collidepoint(pos):
+                return value
+        return None
+
+    def _cell_rect(self, row, col):
+        return pygame.Rect(self.board_origin[0] + col * self.cell, self.board_origin[1] + row * self.cell,
+                           self.cell, self.cell)
+
+    def _palette_rect(self, value):
+        return pygame.Rect(MARGIN + (value - 1) * 44, self.palette_top + 12, 40, 40)
+
+    def _draw(self):
+        """Redraw the cells, status bar and palette that changed and push only those rects."""
+        if self._full_redraw:
+            self.screen.fill(BACKGROUND)
+            self._drawn_cells.clear()
+            self._drawn_moves = None
+            self._drawn_status = None
+            self._drawn_palette = None
+            self._full_redraw = False
+            self._dirty.append(self.screen.get_rect())
+
+        board = self.game.board
+        if self._drawn_moves != len(self.game.history):
+            self._drawn_moves = len(self.game.history)
+            cells = [(row, col) for row in range(board.size) for col in range(board.size)]
+        else:
+            cells = [cell for cell in (self._drawn_hover, self.hover) if cell is not None]
+        self._drawn_hover = self.hover
+        for row, col in cells:
+            cell = board.grid[row][col]
+            owner = board.ownership[row][col]
+            state = (
+                None if cell is None else int(cell),
+                None if owner is None else self._player_index(owner),
+                bool(board.card_used_in_combination[row][col]),
+                self.hover == (row, col)
+            )
+            if self._drawn_cells.get((row, col)) != state:
+                self._drawn_cells[(row, col)] = state
+                self._dirty.append(self._draw_cell(row, col, *state))
+
+        thinking = self.pending is not None
+        status = (self.message, tuple(self.game.scores.values()), self.game.current_player_idx,
+                  thinking, self.frames // 4 % 8 if thinking else None)
+        if status != self._drawn_status:
+            self._drawn_status = status
+            self._dirty.append(self._draw_status(thinking))
+
+        if self._drawn_palette != self.selected_value:
+            self._drawn_palette = self.selected_value
+            self._dirty.append(self._draw_palette())
+
+        if self._dirty:
+            pygame.display.update(self._dirty)
+            self._dirty = []
+
+    def _player_index(self, player_id):
+        for i, player in enumerate(self.game.players):
+            if player.id == player_id:
+                return i
+        return 0
+
+    def _draw_cell(self, row, col, value, owner, scored, hovered):
+        rect = self._cell_rect(row, col)
+        pygame.draw.rect(self.screen, GRID_LINE, rect)
+        inner = rect.inflate(-2, -2)
+        pygame.draw.rect(self.screen, SCORED_CELL if scored else EMPTY_CELL, inner)
+        if value:
+            color = (20, 20, 28) if scored else PLAYER_COLORS[owner % len(PLAYER_COLORS)]
+            text = self.font.render(str(value), True, color)
+            self.screen.blit(text, text.get_rect(center=inner.center))
+        if hovered:
+            pygame.draw.rect(self.screen, HOVER_OUTLINE, inner, 2)
+        return rect
+
+    def _draw_status(self, thinking):
+        rect = pygame.Rect(0, 0, self.screen.get_width(), STATUS_HEIGHT)
+        self.screen.fill(BACKGROUND, rect)
+        scores = "   ".join(f"{player.id}: {self.game.scores[player.id]}" for player in self.game.players)
+        turn = "" if self.game.is_game_over() else f"{self._current_player().id} to move"
+        self.screen.blit(self.small_font.render(scores, True, TEXT), (MARGIN, 10))
+        self.screen.blit(self.small_font.render(f"{turn}   {self.message}".strip(), True, TEXT), (MARGIN, 36))
+        if thinking:
+            center = (rect.right - 28, rect.centery)
+            pygame.draw.circle(self.screen, GRID_LINE, center, 12, 3)
+            angle = self.frames // 4 % 8 * math.pi / 4
+            dot = (center[0] + 12 * math.cos(angle), center[1] + 12 * math.sin(angle))
+            pygame.draw.circle(self.screen, TEXT, dot, 4)
+        return rect
+
+    def _draw_palette(self):
+        rect = pygame.Rect(0, self.palette_top, self.screen.get_width(), PALETTE_HEIGHT)
+        self.screen.fill(BACKGROUND, rect)
+        for value in range(1, 9):
+            box = self._palette_rect(value)
+            selected = value == self.selected_value
+            pygame.draw.rect(self.screen, SCORED_CELL if selected else EMPTY_CELL, box, border_radius=6)
+            text = self.small_font.render(str(value), True, (20, 20, 28) if selected else TEXT)
+            self.screen.blit(text, text.get_rect(center=box.center))
+        return rect
+
+def main(board_size=5):
+    from players.smart_ai_player import SmartAIPlayer
+    game = Game(HumanPlayer("Player 1"), SmartAIPlayer("AI Player", ponder=True, think_delay=0), board_size=board_size)
+    PygameFrontend(game).run()
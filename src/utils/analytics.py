@@ -0,0 +1,236 @@
+import argparse
+import json
+from multiprocessing import Pool
+from game.board import Board, CombinationType
+from game.card import Card
+from utils.game_log import read_games
+
+class RunningStats:
+    """Mergeable count, mean, variance, min and max of a stream of numbers."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """
+        Add one observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """
+        Combine the statistics of another stream into this one.
+
+        Args:
+            other (RunningStats): Statistics of a disjoint stream.
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = other.count, other.mean, other.m2, other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self):
+        """Return the sample variance, or 0.0 with fewer than two observations."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self):
+        """Return a JSON-friendly summary."""
+        return {"count": self.count, "mean": self.mean, "variance": self.variance(), "min": self.min, "max": self.max}
+
+def replay(record):
+    """
+    Replay a recorded game through Board scoring, one move at a time.
+
+    Args:
+        record (dict): A game record as written by utils.game_log.
+
+    Yields:
+        tuple: (player_idx, value, row, col, points, directions) for every move,
+        where directions lists the CombinationType of each window it scored.
+    """
+    board = Board(size=record["board_size"])
+    players = record["players"]
+    for player_idx, value, row, col in record["moves"]:
+        before = {combo_type: len(keys) for combo_type, keys in board.scored_combinations.items()}
+        if not board.place_card(row, col, Card(value), players[player_idx]):
+            raise ValueError(f"Invalid recorded move {value} at ({row}, {col})")
+        points = board.check_combinations(players[player_idx])
+        directions = []
+        if points:
+            for combo_type, keys in board.scored_combinations.items():
+                directions.extend([combo_type] * (len(keys) - before[combo_type]))
+        yield player_idx, value, row, col, points, directions
+
+class GameAnalysis:
+    """
+    Aggregates over a stream of recorded games in memory bounded by the number
+    of distinct board sizes and opening moves, not by the number of games.
+
+    Analyses built from different shards can be combined with merge.
+    """
+
+    def __init__(self):
+        """Initialize an empty analysis."""
+        self.games = 0
+        self.openings = {}
+        self.direction_points = {combo_type.name: 0 for combo_type in CombinationType}
+        self.points_per_turn = {}
+        self.game_length = RunningStats()
+        self.first_mover = {"wins": 0, "losses": 0, "draws": 0}
+
+    def add_game(self, record):
+        """
+        Replay one game and fold it into the aggregates.
+
+        Args:
+            record (dict): A game record as written by utils.game_log.
+        """
+        size = record["board_size"]
+        per_turn = self.points_per_turn.setdefault(size, RunningStats())
+        scores = [0] * len(record["players"])
+        opening = None
+        turns = 0
+        for player_idx, value, row, col, points, directions in replay(record):
+            if opening is None:
+                opening = (size, value, row, col)
+                first_player = player_idx
+            scores[player_idx] += points
+            per_turn.add(points)
+            for combo_type in directions:
+                self.direction_points[combo_type.name] += 1
+            turns += 1
+        if opening is None:
+            return
+
+        self.games += 1
+        self.game_length.add(turns)
+        best = max(scores)
+        if scores.count(best) > 1:
+            outcome = "draws"
+        elif scores[first_player] == best:
+            outcome = "wins"
+        else:
+            outcome = "losses"
+        self.first_mover[outcome] += 1
+        stats = self.openings.setdefault(opening, {"wins": 0, "losses": 0, "draws": 0})
+        stats[outcome] += 1
+
+    def merge(self, other):
+        """
+        Combine the aggregates of another shard into this one.
+
+        Args:
+            other (GameAnalysis): Analysis of a disjoint set of games.
+        """
+        self.games += other.games
+        for opening, stats in other.openings.items():
+            mine = self.openings.setdefault(opening, {"wins": 0, "losses": 0, "draws": 0})
+            for outcome, count in stats.items():
+                mine[outcome] += count
+        for name, count in other.direction_points.items():
+            self.direction_points[name] += count
+        for size, stats in other.points_per_turn.items():
+            self.points_per_turn.setdefault(size, RunningStats()).merge(stats)
+        self.game_length.merge(other.game_length)
+        for outcome, count in other.first_mover.items():
+            self.first_mover[outcome] += count
+
+    def summary(self, top_openings=10):
+        """
+        Return a JSON-friendly summary of every aggregate.
+
+        Args:
+            top_openings (int): Number of most played openings to list (default 10).
+
+        Returns:
+            dict: The summary.
+        """
+        def win_rate(stats):
+            played = sum(stats.values())
+            return (stats["wins"] + 0.5 * stats["draws"]) / played if played else None
+
+        openings = sorted(self.openings.items(), key=lambda item: sum(item[1].values()), reverse=True)
+        return {
+            "games": self.games,
+            "first_mover": dict(self.first_mover, win_rate=win_rate(self.first_mover)),
+            "direction_points": dict(self.direction_points),
+            "points_per_turn": {str(size): stats.to_dict() for size, stats in sorted(self.points_per_turn.items())},
+            "game_length": self.game_length.to_dict(),
+            "openings": [
+                {"board_size": size, "value": value, "row": row, "col": col,
+                 "games": sum(stats.values()), "win_rate": win_rate(stats)}
+                for (size, value, row, col), stats in openings[:top_openings]
+            ]
+        }
+
+def analyze(records, analysis=None):
+    """
+    Fold a stream of game records into an analysis.
+
+    Args:
+        records: Iterable of game records, e.g. utils.game_log.read_games(paths).
+        analysis (GameAnalysis): Analysis to extend (default: a new one).
+
+    Returns:
+        GameAnalysis: The updated analysis.
+    """
+    analysis = analysis or GameAnalysis()
+    for record in records:
+        analysis.add_game(record)
+    return analysis
+
+def _analyze_file(path):
+    """Analyze a single log file; used as a worker task."""
+    return analyze(read_games(path))
+
+def analyze_files(paths, processes=1):
+    """
+    Analyze log files, one shard per file, in parallel worker processes.
+
+    Args:
+        paths: List of log paths.
+        processes (int): Number of worker processes (default 1: analyze in this process).
+
+    Returns:
+        GameAnalysis: The merged analysis.
+    """
+    if processes <= 1:
+        return analyze(read_games(paths))
+    analysis = GameAnalysis()
+    with Pool(processes) as pool:
+        for shard in pool.imap_unordered(_analyze_file, paths):
+            analysis.merge(shard)
+    return analysis
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-pass analytics over recorded games.")
+    parser.add_argument("paths", nargs="+", help="JSON Lines game logs (optionally .gz)")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes, one shard per file")
+    parser.add_argument("--top-openings", type=int, default=10)
+    args = parser.parse_args()
+    analysis = analyze_files(args.paths, args.processes)
+    print(json.dumps(analysis.summary(args.top_openings), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import random
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from game.game import Game
+
+PROTOCOL_VERSION = 1
+
+def make_player(config):
+    """
+    Build a headless player from a JSON-friendly config.
+
+    Args:
+        config (dict): {"type": "smart" | "value_function", "name": ..., plus player options}.
+
+    Returns:
+        A player instance.
+    """
+    options = {key: value for key, value in config.items() if key not in ("type", "name")}
+    if config["type"] == "smart":
+        from players.smart_ai_player import SmartAIPlayer
+        return SmartAIPlayer(config["name"], think_delay=0, **options)
+    if config["type"] == "value_function":
+        from players.value_function_player import ValueFunctionPlayer
+        return ValueFunctionPlayer(config["name"], **options)
+    raise ValueError(f"Unknown player type: {config['type']}")
+
+def play_job(job):
+    """
+    Play one headless game.
+
+    Args:
+        job (dict): {"board_size": int, "players": [config, config], "seed": int}.
+
+    Returns:
+        dict: The game record (see Game.to_record) with the job's seed.
+    """
+    random.seed(job["seed"])
+    player1, player2 = (make_player(config) for config in job["players"])
+    game = Game(player1, player2, board_size=job["board_size"], headless=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        while not game.is_game_over():
+            game.play_turn()
+    record = game.to_record()
+    record["seed"] = job["seed"]
+    return record
+
+def make_jobs(games, board_sizes, player_configs, seed=0):
+    """
+    Build the job list of a self-play run, alternating who moves first.
+
+    Args:
+        games (int): Games per board size.
+        board_sizes: Board sizes to play on.
+        player_configs: The two player configs.
+        seed (int): Base seed; every job gets its own.
+
+    Returns:
+        list: Job dicts for Coordinator.
+    """
+    jobs = []
+    for size in board_sizes:
+        for i in range(games):
+            players = list(player_configs) if i % 2 == 0 else list(reversed(player_configs))
+            jobs.append({"board_size": size, "players": players, "seed": seed + len(jobs)})
+    return jobs
+
+def _send(stream, message):
+    """Write one newline-delimited JSON message."""
+    stream.write(json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n")
+    stream.flush()
+
+def _receive(stream):
+    """Read one newline-delimited JSON message, or None when the peer has disconnected."""
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+class Coordinator:
+    """
+    Hands out batches of self-play jobs to TCP workers and collects their games.
+
+    A batch leased by a worker that disconnects, or that does not finish within
+    lease_timeout seconds, goes back to the queue. A connection that stays silent
+    for lease_timeout seconds (a host that lost power or network) is dropped,
+    which also releases its batches. Games of a batch are only
+    accepted once the whole batch is complete, so re-queued batches are never
+    counted twice.
+    """
+
+    def __init__(self, jobs, batch_size=10, host="127.0.0.1", port=0, on_records=None, lease_timeout=600.0):
+        """
+        Initialize the coordinator.
+
+        Args:
+            jobs: List of job dicts, e.g. from make_jobs.
+            batch_size (int): Jobs per batch (default 10).
+            host (str): Interface to listen on (default 127.0.0.1).
+            port (int): Port to listen on (default 0: any free port).
+            on_records: Called with the game records of every completed batch (default: keep them in self.records).
+            lease_timeout (float): Seconds after which an unfinished batch is re-queued and a silent
+                worker connection is dropped (default 600). Must exceed the time of the longest game.
+        """
+        self.batch_size = batch_size
+        self.lease_timeout = lease_timeout
+        self.records = []
+        self.on_records = on_records or self.records.extend
+        self.games_completed = 0
+        self.batches_requeued = 0
+        self.started_at = None
+        self.finished_at = None
+        self._queue = deque(
+            (batch_id, jobs[start:start + batch_size])
+            for batch_id, start in enumerate(range(0, len(jobs), batch_size))
+        )
+        self._total_batches = len(self._queue)
+        self._leases = {}
+        self._done = set()
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self._queue:
+            self._finished.set()
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            timeout = lease_timeout
+
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            def handle(self):
+                coordinator._serve(self.rfile, self.wfile)
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler, bind_and_activate=False)
+        self._server.allow_reuse_address = True
+        self._server.daemon_threads = True
+        self._server.server_bind()
+        self._server.server_activate()
+        self.address = self._server.server_address
+        self._thread = None
+
+    def start(self):
+        """Start serving workers on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def wait(self, timeout=None, report_every=None):
+        """
+        Block until every batch is complete.
+
+        Args:
+            timeout (float): Give up after this many seconds (default: wait forever).
+            report_every (float): Print progress every this many seconds (default: never).
+
+        Returns:
+            bool: True if the run finished.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        last_report = time.monotonic()
+        while not self._finished.wait(0.1):
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return False
+            if report_every is not None and now - last_report >= report_every:
+                last_report = now
+                stats = self.stats()
+                print(f"{stats['games_completed']} games, {stats['batches_done']}/{stats['batches_total']} batches, "
+                      f"{stats['games_per_second']:.1f} games/s")
+        return True
+
+    def shutdown(self):
+        """Stop accepting workers."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self):
+        """
+        Report progress and throughput.
+
+        Returns:
+            dict: Completed games and batches, re-queued batches and games per second.
+        """
+        with self._lock:
+            end = self.finished_at or time.monotonic()
+            elapsed = end - self.started_at if self.started_at is not None else 0.0
+            return {
+                "games_completed": self.games_completed,
+                "batches_done": len(self._done),
+                "batches_total": self._total_batches,
+                "batches_leased": len(self._leases),
+                "batches_requeued": self.batches_requeued,
+                "games_per_second": self.games_completed / elapsed if elapsed > 0 else 0.0
+            }
+
+    def _lease(self, owner):
+        """Take the next batch off the queue for a worker, or return None if nothing is available yet."""
+        with self._lock:
+            if self.lease_timeout is not None:
+                now = time.monotonic()
+                for batch_id, (jobs, leased_at, _) in list(self._leases.items()):
+                    if now - leased_at > self.lease_timeout:
+                        del self._leases[batch_id]
+                        self._queue.append((batch_id, jobs))
+                        self.batches_requeued += 1
+            if not self._queue:
+                return None
+            batch_id, jobs = self._queue.popleft()
+            self._leases[batch_id] = (jobs, time.monotonic(), owner)
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+            return batch_id, jobs
+
+    def _release(self, owner, batch_ids):
+        """Put the batches a departed worker still held back on the queue."""
+        with self._lock:
+            for batch_id in batch_ids:
+                lease = self._leases.get(batch_id)
+                if lease is not None and lease[2] is owner:
+                    del self._leases[batch_id]
+                    self._queue.appendleft((batch_id, lease[0]))
+                    self.batches_requeued += 1
+
+    def _complete(self, batch_id, records):
+        """Accept the games of a finished batch, unless another worker already delivered it."""
+        with self._lock:
+            if batch_id in self._done:
+                return
+            self._leases.pop(batch_id, None)
+            self._queue = deque(entry for entry in self._queue if entry[0] != batch_id)
+            self._done.add(batch_id)
+            self.games_completed += len(records)
+            self.on_records(records)
+            if len(self._done) == self._total_batches:
+                self.finished_at = time.monotonic()
+                self._finished.set()
+
+    def _serve(self, rfile, wfile):
+        """Talk to one worker connection until it leaves or the run is over."""
+        owner = object()
+        leased = set()
+        partial = {}
+        try:
+            while True:
+                message = _receive(rfile)
+                if message is None:
+                    return
+                kind = message["type"]
+                if kind == "request":
+                    if self._finished.is_set():
+                        _send(wfile, {"type": "done"})
+                        return
+                    batch = self._lease(owner)
+                    if batch is None:
+                        _send(wfile, {"type": "wait", "seconds": 0.2})
+                        continue
+                    batch_id, jobs = batch
+                    leased.add(batch_id)
+                    partial[batch_id] = []
+                    _send(wfile, {"type": "batch", "version": PROTOCOL_VERSION, "batch_id": batch_id, "jobs": jobs})
+                elif kind == "game":
+                    partial.setdefault(message["batch_id"], []).append(message["record"])
+                elif kind == "complete":
+                    batch_id = message["batch_id"]
+                    self._complete(batch_id, partial.pop(batch_id, []))
+                    leased.discard(batch_id)
+        except (OSError, ValueError):
+            return
+        finally:
+            self._release(owner, leased)
+
+def run_worker(host, port, retry_for=10.0):
+    """
+    Pull batches from a coordinator, play them and stream each game back.
+
+    Args:
+        host (str): Coordinator host.
+        port (int): Coordinator port.
+        retry_for (float): Seconds to keep retrying the initial connection (default 10).
+
+    Returns:
+        int: The number of games played.
+    """
+    deadline = time.monotonic() + retry_for
+    while True:
+        try:
+            connection = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.2)
+
+    played = 0
+    with connection, connection.makefile("rwb") as stream:
+        while True:
+            _send(stream, {"type": "request"})
+            message = _receive(stream)
+            if message is None or message["type"] == "done":
+                return played
+            if message["type"] == "wait":
+                time.sleep(message["seconds"])
+                continue
+            if message.get("version") != PROTOCOL_VERSION:
+                raise ValueError(f"Unsupported protocol version: {message.get('version')}")
+            for job in message["jobs"]:
+                _send(stream, {"type": "game", "batch_id": message["batch_id"], "record": play_job(job)})
+                played += 1
+            _send(stream, {"type": "complete", "batch_id": message["batch_id"]})
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed headless self-play over TCP.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    coordinator_parser = subparsers.add_parser("coordinator", help="hand out jobs and collect games")
+    coordinator_parser.add_argument("--host", default="0.0.0.0")
+    coordinator_parser.add_argument("--port", type=int, default=5050)
+    coordinator_parser.add_argument("--games", type=int, default=100, help="games per board size")
+    coordinator_parser.add_argument("--sizes", type=int, nargs="+", default=[5])
+    coordinator_parser.add_argument("--players", nargs=2, default=["smart", "value_function"],
+                                    choices=["smart", "value_function"])
+    coordinator_parser.add_argument("--batch-size", type=int, default=10)
+    coordinator_parser.add_argument("--lease-timeout", type=float, default=600.0,
+                                    help="seconds before an unfinished batch or a silent worker is given up")
+    coordinator_parser.add_argument("--seed", type=int, default=0)
+    coordinator_parser.add_argument("--out", default="self_play.jsonl", help="JSON Lines log of the games")
+    coordinator_parser.add_argument("--local-workers", type=int, default=0, help="also start this many local workers")
+
+    worker_parser = subparsers.add_parser("worker", help="play batches for a coordinator")
+    worker_parser.add_argument("--host", default="127.0.0.1")
+    worker_parser.add_argument("--port", type=int, default=5050)
+
+    args = parser.parse_args()
+    if args.command == "worker":
+        print(f"Played {run_worker(args.host, args.port)} games")
+        return
+
+    from utils.game_log import write_games
+    configs = [{"type": kind, "name": f"{kind} {i + 1}"} for i, kind in enumerate(args.players)]
+    jobs = make_jobs(args.games, args.sizes, configs, args.seed)
+    coordinator = Coordinator(jobs, args.batch_size, args.host, args.port,
+                              on_records=lambda records: write_games(args.out, records),
+                              lease_timeout=args.lease_timeout)
+    coordinator.start()
+    host, port = coordinator.address
+    print(f"Coordinator listening on {host}:{port} with {len(jobs)} games")
+    workers = [
+        multiprocessing.Process(target=run_worker, args=("127.0.0.1", port), daemon=True)
+        for _ in range(args.local_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    coordinator.wait(report_every=5.0)
+    coordinator.shutdown()
+    print(json.dumps(coordinator.stats(), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import gzip
+import json
+
+def _open(path, mode):
+    """Open a log file, transparently handling gzip-compressed ones."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+def write_games(path, records, append=True):
+    """
+    Write game records as JSON Lines, one game per line.
+
+    Args:
+        path (str): Log file; a ".gz" suffix writes a gzip-compressed log.
+        records: Iterable of dicts as returned by Game.to_record.
+        append (bool): Append to an existing log instead of replacing it (default True).
+
+    Returns:
+        int: The number of games written.
+    """
+    count = 0
+    with _open(path, "a" if append else "w") as f:
+        for record in records:
+            f.write(json.dumps(record, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+def read_games(paths):
+    """
+    Stream game records from one or more JSON Lines logs without loading them into memory.
+
+    Args:
+        paths: A log path or a list of log paths.
+
+    Yields:
+        dict: One game record per line.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        with _open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
@@ -0,0 +1,169 @@
+import hashlib
+import sqlite3
+import threading
+import weakref
+
+class PositionStore:
+    """
+    Persistent store of evaluated positions shared across processes and runs.
+
+    Backed by SQLite in WAL mode so any number of processes can read while one
+    writes. Writes are buffered and committed in batches; pending writes are
+    also committed on close, when the store is garbage collected and at
+    interpreter exit.
+    """
+
+    def __init__(self, path, batch_size=64, timeout=30.0):
+        """
+        Open (or create) a position store.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            batch_size (int): Number of pending writes that triggers a commit (default 64).
+            timeout (float): Seconds to wait for another process's write lock (default 30).
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS positions ("
+            "key BLOB PRIMARY KEY, row INTEGER, col INTEGER, value INTEGER, score REAL)"
+        )
+        self._connection.commit()
+        self._finalizer = weakref.finalize(self, _close, self._connection, self._pending, self._lock)
+
+    @staticmethod
+    def position_key(board, player_id, namespace=""):
+        """
+        Compute the canonical key of a position as seen by a player.
+
+        The key depends only on the board contents (values, ownership, used
+        directions and scored windows), not on the order the cards were played.
+
+        Args:
+            board: The game board.
+            player_id: The player to move.
+            namespace (str): Separates entries of different evaluators.
+
+        Returns:
+            bytes: A 16-byte key.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{namespace}\0{player_id}\0".encode("utf-8"))
+        digest.update(board.to_bytes())
+        return digest.digest()
+
+    def get(self, key):
+        """
+        Look up a position.
+
+        Args:
+            key (bytes): Key from position_key.
+
+        Returns:
+            tuple: (value, row, col, score) of the stored best move, or None on a miss.
+        """
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = self._connection.execute(
+                    "SELECT value, row, col, score FROM positions WHERE key = ?", (key,)
+                ).fetchone()
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return tuple(entry)
+
+    def reject(self, key):
+        """
+        Report that the entry get just returned for key could not be used.
+
+        The lookup is counted as a miss instead of a hit and the entry is deleted.
+
+        Args:
+            key (bytes): Key passed to get.
+        """
+        with self._lock:
+            self.hits -= 1
+            self.misses += 1
+            self._pending.pop(key, None)
+            with self._connection:
+                self._connection.execute("DELETE FROM positions WHERE key = ?", (key,))
+
+    def put(self, key, value, row, col, score=None):
+        """
+        Record the best move for a position. The write is buffered until the batch is full.
+
+        Args:
+            key (bytes): Key from position_key.
+            value (int): Card value of the best move.
+            row (int): Row of the best move.
+            col (int): Column of the best move.
+            score (float): Heuristic score of the move, if known.
+        """
+        with self._lock:
+            self._pending[key] = (value, row, col, score)
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        """Commit every buffered write."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Commit buffered writes; the caller holds the lock."""
+        _commit(self._connection, self._pending)
+
+    def hit_rate(self):
+        """Return the fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Report lookup statistics.
+
+        Returns:
+            dict: Hits, misses, hit rate and pending writes.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "pending": len(self._pending)
+        }
+
+    def close(self):
+        """Flush pending writes and close the database."""
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def _commit(connection, pending):
+    """Write pending entries to the database and clear them."""
+    if not pending:
+        return
+    with connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO positions (key, value, row, col, score) VALUES (?, ?, ?, ?, ?)",
+            [(key,) + entry for key, entry in pending.items()]
+        )
+    pending.clear()
+
+def _close(connection, pending, lock):
+    """Commit pending entries and close the connection; run once by the store's finalizer."""
+    with lock:
+        _commit(connection, pending)
+        connection.close()
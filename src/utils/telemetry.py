@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+
+METRIC_PREFIX = "three_for_ten"
+
+HISTOGRAMS = {
+    "move_decision_seconds": "Time spent by a player choosing a move.",
+    "scoring_seconds": "Time spent in Board.check_combinations.",
+    "render_seconds": "Time spent rendering the game state."
+}
+COUNTERS = {
+    "invalid_moves": "Moves rejected by the board.",
+    "points_scored": "Points scored by completed combinations.",
+    "games_played": "Games played to completion."
+}
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with log-spaced bounds from 10us to about 84s."""
+
+    BOUNDS = tuple(round(0.00001 * 2 ** i, 8) for i in range(24))
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.bucket_counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """
+        Record a single observation.
+
+        Args:
+            value (float): The observed latency in seconds.
+        """
+        self.bucket_counts[bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimate a quantile as the upper bound of the bucket that contains it.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimated latency in seconds, or None if nothing was observed.
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.BOUNDS[i] if i < len(self.BOUNDS) else float("inf")
+        return float("inf")
+
+    def to_dict(self):
+        """Return a JSON-friendly summary of the histogram."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(bound) for bound in self.BOUNDS] + ["+Inf"], self.bucket_counts))
+        }
+
+class Telemetry:
+    """
+    Collects per-turn latency histograms and game counters.
+
+    One instance can be shared by every Game of a runner; metrics are labelled
+    by player and board size.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Initialize empty telemetry.
+
+        Args:
+            clock: Monotonic clock returning seconds (default time.perf_counter).
+        """
+        self.clock = clock
+        self.started_at = clock()
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, **labels):
+        """
+        Record a latency observation.
+
+        Args:
+            name (str): One of the names in HISTOGRAMS.
+            value (float): The latency in seconds.
+            **labels: Label values such as player and board_size.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram()
+            histogram.observe(value)
+
+    def increment(self, name, amount=1, **labels):
+        """
+        Increase a counter.
+
+        Args:
+            name (str): One of the names in COUNTERS.
+            amount (int): The amount to add (default 1).
+            **labels: Label values such as player and board_size.
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def games_per_second(self):
+        """Return the number of completed games per second since this telemetry was created."""
+        elapsed = self.clock() - self.started_at
+        with self._lock:
+            games = sum(value for (name, _), value in self.counters.items() if name == "games_played")
+        return games / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self):
+        """
+        Return a JSON-friendly snapshot of every metric.
+
+        Returns:
+            dict: Histograms, counters and throughput.
+        """
+        with self._lock:
+            histograms = [
+                {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                for (name, labels), histogram in sorted(self.histograms.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+        return {
+            "timestamp": time.time(),
+            "histograms": histograms,
+            "counters": counters,
+            "games_per_second": self.games_per_second()
+        }
+
+    def to_json(self):
+        """Export a snapshot as a JSON string."""
+        return json.dumps(self.snapshot())
+
+    def to_openmetrics(self):
+        """
+        Export every metric in the OpenMetrics text format.
+
+        Returns:
+            str: The exposition, terminated by '# EOF'.
+        """
+        lines = []
+        with self._lock:
+            for name, help_text in HISTOGRAMS.items():
+                series = sorted((labels, histogram) for (metric, labels), histogram in self.histograms.items() if metric == name)
+                if not series:
+                    continue
+                metric_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# TYPE {metric_name} histogram")
+                lines.append(f"# UNIT {metric_name} seconds")
+                lines.append(f"# HELP {metric_name} {help_text}")
+                for labels, histogram in series:
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.BOUNDS + ("+Inf",), histogram.bucket_counts):
+                        cumulative += bucket_count
+                        le = bound if bound == "+Inf" else repr(bound)
+                        lines.append(f"{metric_name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{metric_name}_count{_format_labels(labels)} {histogram.count}")
+                    lines.append(f"{metric_name}_sum{_format_labels(labels)} {histogram.sum!r}")
+            for name, help_text in COUNTERS.items():
+                series = sorted((labels, value) for (metric, labels), value in self.counters.items() if metric == name)
+                if not series:
+                    continue
+                metric_name = f"{METRIC_PREFIX}_{name}"
+                lines.append(f"# TYPE {metric_name} counter")
+                lines.append(f"# HELP {metric_name} {help_text}")
+                for labels, value in series:
+                    lines.append(f"{metric_name}_total{_format_labels(labels)} {value}")
+        metric_name = f"{METRIC_PREFIX}_games_per_second"
+        lines.append(f"# TYPE {metric_name} gauge")
+        lines.append(f"# HELP {metric_name} Completed games per second since the runner started.")
+        lines.append(f"{metric_name} {self.games_per_second()!r}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+def _format_labels(labels):
+    """Format label pairs as an OpenMetrics label set."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+def _escape(value):
+    """Escape a label value for the OpenMetrics text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,43 @@
+import random
+import pytest
+from game.board import Board
+from game.card import Card
+from game.batch_scoring import score_batch, stack_records
+
+def random_record(rng, size, moves):
+    """Build a random game record with the given number of moves; values favour sums of 10."""
+    cells = [(row, col) for row in range(size) for col in range(size)]
+    rng.shuffle(cells)
+    return {
+        "board_size": size,
+        "players": ["Player 1", "Player 2"],
+        "moves": [[i % 2, rng.choice([1, 2, 3, 4, 5, 6, 7, 8, 2, 3, 4, 5]), row, col]
+                  for i, (row, col) in enumerate(cells[:moves])]
+    }
+
+def replay(record):
+    """Score a record move by move with Board; return the board and points per player."""
+    board = Board(size=record["board_size"])
+    points = [0] * len(record["players"])
+    for player_idx, value, row, col in record["moves"]:
+        board.place_card(row, col, Card(value), player_idx)
+        points[player_idx] += board.check_combinations(player_idx)
+    return board, points
+
+@pytest.mark.parametrize("size", [3, 4, 5, 7, 10])
+def test_score_batch_matches_board(size):
+    rng = random.Random(size)
+    records = [random_record(rng, size, size * size) for _ in range(60)]
+    records += [random_record(rng, size, rng.randint(0, size * size)) for _ in range(60)]
+
+    result = score_batch(*stack_records(records))
+
+    for i, record in enumerate(records):
+        board, points = replay(record)
+        assert result.scored_combinations(i) == board.scored_combinations
+        assert result.points[i].tolist() == points
+
+def test_stack_records_rejects_mixed_sizes():
+    rng = random.Random(0)
+    with pytest.raises(ValueError):
+        stack_records([random_record(rng, 4, 5), random_record(rng, 5, 5)])
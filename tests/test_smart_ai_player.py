@@ -0,0 +1,50 @@
+import contextlib
+import io
+import random
+import pytest
+from game.board import Board
+from game.card import Card
+from players.smart_ai_player import SmartAIPlayer
+
+def random_board(rng, size):
+    """Fill a random number of cells of a board with random cards of two players."""
+    board = Board(size=size)
+    for _ in range(rng.randint(0, size * size - 1)):
+        row, col = board.random_empty_cell(rng)
+        board.place_card(row, col, Card(rng.randint(1, 8)), rng.choice(["Player 1", "AI Player"]))
+        board.check_combinations(board.ownership[row][col])
+    return board
+
+@pytest.mark.parametrize("seed", range(20))
+def test_candidate_classes_are_equivalent(monkeypatch, seed):
+    monkeypatch.setattr(random, "uniform", lambda a, b: 0)
+    rng = random.Random(seed)
+    board = random_board(rng, rng.choice([5, 6, 8]))
+    ai = SmartAIPlayer("AI Player", think_delay=0)
+    ai.initialize_cards(range(1, 9))
+    empty_positions = board.empty_cells()
+
+    candidates = ai._generate_candidates(board, empty_positions)
+
+    assert sorted((row, col, value) for row, col, values in candidates for value in values) == \
+        sorted((row, col, value) for row, col in empty_positions for value in range(1, 9))
+    for row, col, values in candidates:
+        assert len({ai._evaluate_move(board, Card(value), row, col) for value in values}) == 1
+    best = max(ai._evaluate_move(board, Card(value), row, col) for row, col in empty_positions for value in range(1, 9))
+    assert max(ai._evaluate_move(board, Card(values[0]), row, col) for row, col, values in candidates) == best
+
+@pytest.mark.parametrize("size", [20, 30])
+def test_budgeted_search_takes_immediate_score(size):
+    board = Board(size=size)
+    row = size - 2
+    for position in [(row, 3), (row, 4), (row - 2, 5), (row - 1, 5)]:
+        board.place_card(*position, Card(3), "Player 1")
+    ai = SmartAIPlayer("AI Player", think_delay=0, time_budget_ms=5)
+    ai.initialize_cards(range(1, 9))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        card, row, col = ai.make_move(board)
+
+    assert ai.last_search["coverage"] < 1.0
+    assert board.place_card(row, col, card, ai.id)
+    assert board.check_combinations(ai.id) > 0
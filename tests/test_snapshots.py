@@ -0,0 +1,111 @@
+import contextlib
+import io
+import random
+import pytest
+from game.board import Board, CombinationType
+from game.card import Card
+from game.game import Game
+from players.smart_ai_player import SmartAIPlayer
+
+def random_board(rng, size, moves):
+    """Play random cards of two players on a board, scoring each move."""
+    board = Board(size=size)
+    for i in range(moves):
+        player = "Player 1" if i % 2 == 0 else "Player 2"
+        row, col = board.random_empty_cell(rng)
+        board.place_card(row, col, Card(rng.choice([1, 2, 3, 4, 5, 6, 7, 8, 2, 3, 4, 5])), player)
+        board.check_combinations(player)
+    return board
+
+def assert_same_board(restored, board):
+    assert restored.size == board.size
+    assert restored.grid == board.grid
+    assert restored.ownership == board.ownership
+    assert restored.card_used_in_combination == board.card_used_in_combination
+    assert restored.scored_combinations == board.scored_combinations
+    assert sorted(restored.empty_cells()) == sorted(board.empty_cells())
+
+def make_game(size=5):
+    return Game(SmartAIPlayer("Player 1", think_delay=0), SmartAIPlayer("Player 2", think_delay=0),
+                board_size=size, headless=True)
+
+@pytest.mark.parametrize("size,moves", [(3, 0), (3, 9), (5, 12), (5, 25), (10, 60)])
+def test_board_round_trip(size, moves):
+    board = random_board(random.Random(size * 100 + moves), size, moves)
+    assert_same_board(Board.from_bytes(board.to_bytes()), board)
+
+def test_board_rejects_truncated_and_trailing_data():
+    data = random_board(random.Random(1), 5, 20).to_bytes()
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            Board.from_bytes(data[:length])
+    with pytest.raises(ValueError):
+        Board.from_bytes(data + b"\0")
+
+def corrupt(data, offset, value):
+    return data[:offset] + bytes([value]) + data[offset + 1:]
+
+def test_board_rejects_corrupt_data():
+    board = Board(size=3)
+    board.place_card(0, 0, Card(5), "Player 1")
+    data = board.to_bytes()
+    cells = len(data) - 9 * 3 - 4 * 2
+    with pytest.raises(ValueError):
+        Board.from_bytes(b"XX" + data[2:])
+    with pytest.raises(ValueError):
+        Board.from_bytes(corrupt(data, 2, 99))
+    with pytest.raises(ValueError):
+        Board.from_bytes(corrupt(data, cells, 9))
+    with pytest.raises(ValueError):
+        Board.from_bytes(corrupt(data, cells + 9, 2))
+    with pytest.raises(ValueError):
+        Board.from_bytes(corrupt(data, cells + 18, 16))
+    with pytest.raises(ValueError):
+        Board.from_bytes(corrupt(data, cells + 1 + 9, 1))
+
+def test_board_rejects_scored_window_off_the_board():
+    board = Board(size=3)
+    board.scored_combinations[CombinationType.HORIZONTAL].add((0, 1))
+    with pytest.raises(ValueError):
+        Board.from_bytes(board.to_bytes())
+
+def test_board_requires_short_string_owners():
+    board = Board(size=3)
+    board.place_card(0, 0, Card(5), 1)
+    with pytest.raises(ValueError):
+        board.to_bytes()
+    board.ownership[0][0] = "x" * 256
+    with pytest.raises(ValueError):
+        board.to_bytes()
+
+def test_game_round_trip_keeps_history():
+    random.seed(3)
+    game = make_game()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(13):
+            game.play_turn()
+    resumed = make_game(size=3)
+    resumed.restore(game.snapshot())
+
+    assert_same_board(resumed.board, game.board)
+    assert resumed.scores == game.scores
+    assert resumed.current_player_idx == game.current_player_idx
+    assert resumed.to_record() == game.to_record()
+
+def test_game_rejects_bad_snapshots():
+    game = make_game()
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.play_turn()
+    data = game.snapshot()
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            make_game().restore(data[:length])
+    with pytest.raises(ValueError):
+        make_game().restore(data + b"\0")
+    with pytest.raises(ValueError):
+        make_game().restore(corrupt(data, 3, 2))
+    with pytest.raises(ValueError):
+        make_game().restore(corrupt(data, 2, 1))
+    other = Game(SmartAIPlayer("Player 1"), SmartAIPlayer("Someone else"), board_size=5, headless=True)
+    with pytest.raises(ValueError):
+        other.restore(data)